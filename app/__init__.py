@@ -69,6 +69,12 @@ def create_app(config_name: str = 'default') -> Flask:
     else:
         app.logger.info("Using SQLAlchemy database")
 
+    engine_options = app.config['SQLALCHEMY_ENGINE_OPTIONS']
+    pool_capacity = engine_options.get('pool_size', 0) + engine_options.get('max_overflow', 0)
+    if 'pool_size' in engine_options and pool_capacity < app.config['DB_THREAD_POOL_WORKERS']:
+        app.logger.warning(f"Database pool capacity ({pool_capacity}) is smaller than DB_THREAD_POOL_WORKERS "
+                           f"({app.config['DB_THREAD_POOL_WORKERS']}); executor workers will wait on pool_timeout")
+
     # Initialize Flask-Login
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
@@ -167,9 +173,6 @@ def create_app(config_name: str = 'default') -> Flask:
     # User loader for Flask-Login
     @login_manager.user_loader
     def load_user(user_id):
-        import asyncio
-        import concurrent.futures
-
         from flask import current_app, has_app_context
 
         from app.services.database_service import db_service
@@ -181,17 +184,8 @@ def create_app(config_name: str = 'default') -> Flask:
             # If no app context, return None (user not authenticated)
             return None
 
-        def run_async_with_context():
-            def async_operation():
-                with app.app_context():
-                    return asyncio.run(db_service.get_user_by_id(user_id))
-
-            return async_operation()
-
-        # Run in a separate thread with proper app context
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_async_with_context)
-            return future.result()
+        # Run on the shared database executor with proper app context
+        return db_service.run_sync(app, db_service.get_user_by_id, user_id)
 
     # Initialize OAuth
     from app.routes.auth import oauth
@@ -259,6 +253,8 @@ def _initialize_database_with_retry(app: Flask, max_retries: int = 3, delay: int
         try:
             logger.info(f"Attempting database initialization (attempt {attempt + 1}/{max_retries})")
             db.create_all()
+            _create_missing_indexes()
+            _seed_content_counters()
             _create_default_admin(app)
             logger.info("Database initialization successful")
             return
@@ -288,6 +284,53 @@ def _initialize_database_with_retry(app: Flask, max_retries: int = 3, delay: int
                     break
 
 
+def _create_missing_indexes() -> None:
+    """Add model indexes that are missing from tables created before the index was declared
+
+    create_all() skips existing tables entirely, so indexes added to a model later would
+    otherwise only exist on fresh databases. Uses CREATE INDEX IF NOT EXISTS where the
+    database supports it (reflection can't see expression indexes), so this is a no-op
+    once the schema is up to date.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.schema import CreateIndex
+
+    logger = logging.getLogger(__name__)
+    if_not_exists = db.engine.dialect.name in ('postgresql', 'sqlite')
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                if if_not_exists:
+                    with db.engine.begin() as connection:
+                        connection.execute(CreateIndex(index, if_not_exists=True))
+                else:
+                    index.create(bind=db.engine, checkfirst=True)
+            except SQLAlchemyError as e:
+                # e.g. another worker created it concurrently
+                logger.warning("Could not create index %s: %s", index.name, e)
+
+
+def _seed_content_counters() -> None:
+    """Backfill the aggregate counter tables the first time they exist"""
+    from sqlalchemy.exc import IntegrityError
+
+    from app.models.content import Content
+    from app.models.content_counter import ContentStatusCount, ModerationDecisionCount
+    from app.models.moderation_result import ModerationResult
+
+    for counter, source in ((ContentStatusCount, Content), (ModerationDecisionCount, ModerationResult)):
+        if db.session.query(counter.query.exists()).scalar() or \
+                not db.session.query(source.query.exists()).scalar():
+            continue
+        try:
+            counter.rebuild(db.session.connection())
+            db.session.commit()
+            logging.getLogger(__name__).info("Backfilled %s", counter.__tablename__)
+        except IntegrityError:
+            # Another worker seeded the table concurrently
+            db.session.rollback()
+
+
 def _create_default_admin(app: Flask) -> None:
     """Create default admin user"""
     logger = logging.getLogger(__name__)
@@ -1,10 +1,11 @@
 from .api_key import APIKey
 from .api_user import APIUser
 from .content import Content
+from .content_counter import ContentStatusCount, ModerationDecisionCount
 from .moderation_result import ModerationResult
 from .moderation_rule import ModerationRule
 from .project import Project
 from .user import User
 
-__all__ = ['User', 'Project', 'APIKey', 'Content',
-           'ModerationRule', 'ModerationResult', 'APIUser']
+__all__ = ['User', 'Project', 'APIKey', 'Content', 'ContentStatusCount',
+           'ModerationDecisionCount', 'ModerationRule', 'ModerationResult', 'APIUser']
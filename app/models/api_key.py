@@ -13,7 +13,7 @@ class APIKey(db.Model):
     key = db.Column(db.String(64), unique=True, nullable=False)
     name = db.Column(db.String(100), nullable=False)
     project_id = db.Column(db.String(36), db.ForeignKey(
-        'projects.id'), nullable=False)
+        'projects.id'), nullable=False, index=True)
     is_active = db.Column(db.Boolean, default=True)
     last_used = db.Column(db.DateTime)
     usage_count = db.Column(db.Integer, default=0)
@@ -6,6 +6,19 @@ from app import db
 
 class Content(db.Model):
     __tablename__ = 'content'
+    __table_args__ = (
+        # Serves per-project listings ordered by (created_at, id), including keyset pagination
+        db.Index('ix_content_project_created_id', 'project_id', 'created_at', 'id'),
+        # Per-project status listings (manual review queue) ordered by (created_at, id)
+        db.Index('ix_content_project_status_created_id', 'project_id', 'status', 'created_at', 'id'),
+        # Recency counts across all projects (admin stats)
+        db.Index('ix_content_created_at', 'created_at'),
+        # Partial index: flagged content is a small slice of the table. Ordered like the review
+        # queue (scanned backwards for created_at DESC), so it is served without a sort
+        db.Index('ix_content_flagged', 'project_id', 'created_at', 'id',
+                 postgresql_where=db.text("status = 'flagged'"),
+                 sqlite_where=db.text("status = 'flagged'")),
+    )
 
     id = db.Column(db.String(36), primary_key=True,
                    default=lambda: str(uuid.uuid4()))
@@ -43,3 +56,7 @@ class Content(db.Model):
 
     def __repr__(self):
         return f'<Content {self.id}>'
+
+
+# Expression index backing the per-day analytics GROUP BY on DATE(created_at)
+db.Index('ix_content_project_date', Content.project_id, db.func.date(Content.created_at))
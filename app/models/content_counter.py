@@ -0,0 +1,134 @@
+"""Aggregate counters maintained on every Content and ModerationResult write."""
+from sqlalchemy import event, func, inspect, select, update
+
+from app import db
+
+from .content import Content
+from .moderation_result import ModerationResult
+
+
+class ContentStatusCount(db.Model):
+    """Running count of a project's content rows in one status."""
+    __tablename__ = 'content_status_counts'
+
+    project_id = db.Column(db.String(36), db.ForeignKey(
+        'projects.id', ondelete='CASCADE'), primary_key=True)
+    status = db.Column(db.String(20), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    @staticmethod
+    def rebuild(connection, project_id=None):
+        """Recompute counters from the content table (all projects, or one)."""
+        table = ContentStatusCount.__table__
+        delete_stmt = table.delete()
+        source = select(Content.project_id, func.coalesce(Content.status, 'pending'), func.count(Content.id))
+        if project_id:
+            delete_stmt = delete_stmt.where(table.c.project_id == project_id)
+            source = source.where(Content.project_id == project_id)
+        source = source.group_by(Content.project_id, func.coalesce(Content.status, 'pending'))
+        connection.execute(delete_stmt)
+        connection.execute(table.insert().from_select(['project_id', 'status', 'count'], source))
+
+
+class ModerationDecisionCount(db.Model):
+    """Running count of moderation results with one decision (system-wide)."""
+    __tablename__ = 'moderation_decision_counts'
+
+    decision = db.Column(db.String(20), primary_key=True)
+    count = db.Column(db.BigInteger, nullable=False, default=0)
+
+    @staticmethod
+    def rebuild(connection):
+        """Recompute counters from the moderation_results table."""
+        table = ModerationDecisionCount.__table__
+        source = select(ModerationResult.decision, func.count(ModerationResult.id))\
+            .group_by(ModerationResult.decision)
+        connection.execute(table.delete())
+        connection.execute(table.insert().from_select(['decision', 'count'], source))
+
+
+def _adjust(connection, table, keys, delta):
+    """Add delta to the counter row identified by keys, creating the row if needed."""
+    dialect = connection.dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table).values(**keys, count=max(delta, 0))
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c[key] for key in keys],
+            set_={'count': table.c.count + delta}
+        ))
+        return
+
+    result = connection.execute(
+        update(table)
+        .where(*(table.c[key] == value for key, value in keys.items()))
+        .values(count=table.c.count + delta)
+    )
+    if result.rowcount == 0 and delta > 0:
+        connection.execute(table.insert().values(**keys, count=delta))
+
+
+def _adjust_status(connection, project_id, status, delta):
+    _adjust(connection, ContentStatusCount.__table__,
+            {'project_id': project_id, 'status': status or 'pending'}, delta)
+
+
+def record_status_change(connection, project_id, old_status, new_status):
+    """Move one content item between status counters (for writes that bypass the ORM)."""
+    if (old_status or 'pending') != (new_status or 'pending'):
+        _adjust_status(connection, project_id, old_status, -1)
+        _adjust_status(connection, project_id, new_status, 1)
+
+
+def record_decisions(connection, decision_deltas):
+    """Apply {decision: delta} to the decision counters (for writes that bypass the ORM)."""
+    for decision, delta in decision_deltas.items():
+        if delta:
+            _adjust(connection, ModerationDecisionCount.__table__, {'decision': decision}, delta)
+
+
+@event.listens_for(Content, 'after_insert')
+def _count_inserted_content(mapper, connection, target):
+    _adjust_status(connection, target.project_id, target.status, 1)
+
+
+@event.listens_for(Content, 'after_update')
+def _count_updated_content(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+    if not history.has_changes():
+        return
+    if not history.deleted:
+        # Previous value was never loaded (e.g. set after the instance expired)
+        ContentStatusCount.rebuild(connection, target.project_id)
+        return
+    record_status_change(connection, target.project_id, history.deleted[0], target.status)
+
+
+@event.listens_for(Content, 'after_delete')
+def _count_deleted_content(mapper, connection, target):
+    _adjust_status(connection, target.project_id, target.status, -1)
+
+
+@event.listens_for(ModerationResult, 'after_insert')
+def _count_inserted_result(mapper, connection, target):
+    record_decisions(connection, {target.decision: 1})
+
+
+@event.listens_for(ModerationResult, 'after_update')
+def _count_updated_result(mapper, connection, target):
+    history = inspect(target).attrs.decision.history
+    if not history.has_changes():
+        return
+    if not history.deleted:
+        ModerationDecisionCount.rebuild(connection)
+        return
+    if history.deleted[0] != target.decision:
+        record_decisions(connection, {history.deleted[0]: -1, target.decision: 1})
+
+
+@event.listens_for(ModerationResult, 'after_delete')
+def _count_deleted_result(mapper, connection, target):
+    record_decisions(connection, {target.decision: -1})
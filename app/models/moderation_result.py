@@ -15,7 +15,7 @@ class ModerationResult(db.Model):
         db.String(20), nullable=False)  # ai, rule, manual
     moderator_id = db.Column(db.String(100))  # rule_id, ai_model, user_id
     # approved, rejected, flagged
-    decision = db.Column(db.String(20), nullable=False)
+    decision = db.Column(db.String(20), nullable=False, index=True)
     confidence = db.Column(db.Float)  # 0.0 to 1.0
     reason = db.Column(db.Text)
     details = db.Column(db.JSON)  # Additional details about the moderation
@@ -10,7 +10,7 @@ class ModerationRule(db.Model):
     id = db.Column(db.String(36), primary_key=True,
                    default=lambda: str(uuid.uuid4()))
     project_id = db.Column(db.String(36), db.ForeignKey(
-        'projects.id'), nullable=False)
+        'projects.id'), nullable=False, index=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
     # keyword, regex, ai_prompt, etc.
@@ -102,12 +102,22 @@ class Project(db.Model):
 
     def is_member(self, user_id):
         """Check if a user is a member of this project"""
-        return user_id in self.member_ids or user_id == self.user_id
+        if user_id == self.user_id:
+            return True
+        if 'memberships' in self.__dict__:
+            return user_id in self.member_ids
+        # One EXISTS probe instead of loading every membership row
+        return db.session.query(ProjectMember.query.filter_by(
+            project_id=self.id, user_id=user_id).exists()).scalar()
 
     def get_member_role(self, user_id):
         """Get the role of a user in this project"""
         if user_id == self.user_id:
             return 'owner'
+        if 'memberships' not in self.__dict__:
+            # Fetch just this user's role instead of loading every membership row
+            return db.session.query(ProjectMember.role).filter_by(
+                project_id=self.id, user_id=user_id).limit(1).scalar()
         membership = next(
             (m for m in self.memberships if m.user_id == user_id), None)
         return membership.role if membership else None
@@ -4,6 +4,7 @@ from typing import Callable
 
 from flask import Blueprint, current_app, flash, jsonify, redirect, render_template, request, url_for
 from flask_login import current_user
+from sqlalchemy import exists
 
 from app import db
 from app.models.content import Content
@@ -59,28 +60,18 @@ def admin_required(f: Callable) -> Callable:
 @admin_required  # admin_required includes login_required functionality
 async def index():
     """Admin dashboard overview"""
-    # Get system statistics using centralized service
-    stats = await db_service.get_admin_stats()
-
-    # Get recent activity
-    recent_users = await db_service.get_recent_users(5)
-    recent_projects = await db_service.get_recent_projects(5)
-    recent_content = await db_service.get_recent_content_admin(10)
-
-    # Get moderation statistics
-    moderation_stats = {
-        **(await db_service.get_moderation_result_stats()),
-    }
+    # System statistics, recent activity and moderation statistics, loaded concurrently
+    dashboard = await db_service.get_admin_dashboard(users_limit=5, projects_limit=5, content_limit=10)
 
     # Get system settings
     registration_enabled = SystemSettings.is_registration_enabled()
 
     return render_template('admin/index.html',
-                           stats=stats,
-                           recent_users=recent_users,
-                           recent_projects=recent_projects,
-                           recent_content=recent_content,
-                           moderation_stats=moderation_stats,
+                           stats=dashboard['stats'],
+                           recent_users=dashboard['recent_users'],
+                           recent_projects=dashboard['recent_projects'],
+                           recent_content=dashboard['recent_content'],
+                           moderation_stats=dashboard['moderation_stats'],
                            registration_enabled=registration_enabled)
 
 
@@ -184,11 +175,11 @@ async def create_user():
             return redirect(url_for('admin.users'))
 
         # Check if username or email already exists
-        if User.query.filter_by(username=username).first():
+        if db.session.query(exists().where(User.username == username)).scalar():
             flash('Username already exists.', 'error')
             return redirect(url_for('admin.users'))
 
-        if User.query.filter_by(email=email).first():
+        if db.session.query(exists().where(User.email == email)).scalar():
             flash('Email address already exists.', 'error')
             return redirect(url_for('admin.users'))
 
@@ -241,6 +232,7 @@ async def delete_user(user_id):
         # Delete the user
         db.session.delete(user)
         db.session.commit()
+        db_service.invalidate_membership_cache(user_id=user_id)
 
         flash(f'User {username} has been permanently deleted.', 'success')
         return redirect(url_for('admin.users'))
@@ -293,17 +285,17 @@ async def projects():
     # Add counts for each project efficiently using database service
     project_stats = {}
     if all_projects:
-        project_ids = [p.id for p in all_projects]
+        project_ids = [p['id'] for p in all_projects]
 
         # Get bulk statistics using database service
         bulk_stats = await db_service.get_project_bulk_stats(project_ids)
 
         # Create stats dict for template
         for project in all_projects:
-            project_stats[project.id] = {
-                'content_count': bulk_stats['content_counts'].get(project.id, 0),
-                'rules_count': bulk_stats['rules_counts'].get(project.id, 0),
-                'keys_count': bulk_stats['keys_counts'].get(project.id, 0)
+            project_stats[project['id']] = {
+                'content_count': bulk_stats['content_counts'].get(project['id'], 0),
+                'rules_count': bulk_stats['rules_counts'].get(project['id'], 0),
+                'keys_count': bulk_stats['keys_counts'].get(project['id'], 0)
             }
 
     # Create a simple pagination object
@@ -333,7 +325,7 @@ async def projects():
 
     # Calculate statistics efficiently without loading related data
     total_content = Content.query.count()
-    unique_owners = len(set(project.user_id for project in projects.items))
+    unique_owners = len(set(project['user_id'] for project in projects.items))
 
     return render_template('admin/projects.html',
                            projects=projects,
@@ -479,6 +471,7 @@ async def system_health():
 
     from app.services.ai.result_cache import ResultCache
     from app.services.error_tracker import error_tracker
+    from app.services.moderation.rule_cache import rule_cache
 
     # Get system metrics
     process = psutil.Process()
@@ -518,11 +511,12 @@ async def system_health():
         'uptime_hours': uptime_hours
     }
 
-    # Get cache stats (only AI result cache - rules are queried directly from DB)
+    # Get cache stats
     result_cache = ResultCache()
 
     cache_stats = {
-        'ai_cache': result_cache.get_cache_stats()
+        'ai_cache': result_cache.get_cache_stats(),
+        'rule_cache': rule_cache.get_cache_stats()
     }
 
     # Get database connection pool stats
@@ -574,7 +568,7 @@ async def search_user_data():
             return redirect(url_for('admin.data_deletion'))
 
         # Get project info
-        project = Project.query.get(project_id)
+        project = db.session.get(Project, project_id)
 
         # Get all projects for the dropdown
         projects = Project.query.order_by(Project.name).all()
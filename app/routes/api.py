@@ -1,4 +1,6 @@
+import base64
 import re
+from datetime import datetime
 from functools import wraps
 from typing import Callable
 
@@ -45,7 +47,7 @@ def require_api_key(f: Callable) -> Callable:
 
         # Add to request context
         request.api_key = key_obj
-        request.project = key_obj.project
+        request.project_id = key_obj.project_id
 
         return await f(*args, **kwargs)
     return decorated_function
@@ -119,14 +121,14 @@ async def moderate_content(validated_data=None):
         # Find or create API user using centralized service (returns user ID)
         api_user_id = await db_service.get_or_create_api_user(
             external_user_id=external_user_id,
-            project_id=request.project.id
+            project_id=request.project_id
         )
     else:
         api_user_id = None
 
     # Create content record using database service
     content_id = await db_service.create_content(
-        project_id=request.project.id,
+        project_id=request.project_id,
         content_text=str(content_data),
         content_type=content_type,
         api_user_id=api_user_id,
@@ -135,8 +137,8 @@ async def moderate_content(validated_data=None):
 
     if not content_id:
         error_msg = "Failed to create content record"
-        current_app.logger.error(f"{error_msg} - Project: {request.project.id}")
-        error_tracker.track_error('api', error_msg, details={'project_id': request.project.id})
+        current_app.logger.error(f"{error_msg} - Project: {request.project_id}")
+        error_tracker.track_error('api', error_msg, details={'project_id': request.project_id})
         return api_error_response(error_msg, 500, error_code="CONTENT_CREATION_FAILED")
 
     # Start moderation process
@@ -179,7 +181,7 @@ async def get_content(content_id):
 
     content_id = content_id.strip()
 
-    content = await db_service.get_content_by_id_and_project(content_id, request.project.id)
+    content = await db_service.get_content_by_id_and_project(content_id, request.project_id)
 
     if not content:
         return api_error_response('Content not found', 404)
@@ -200,21 +202,30 @@ async def list_content(validated_params=None):
     per_page = validated_params.per_page
     status = validated_params.status
 
+    after = None
+    if validated_params.cursor:
+        after = _decode_cursor(validated_params.cursor)
+        if not after:
+            return api_error_response('Invalid cursor', 400)
+
     offset = (page - 1) * per_page
     content_items = await db_service.get_project_content_with_filters(
-        project_id=request.project.id,
+        project_id=request.project_id,
         status=status,
         limit=per_page,
-        offset=offset
+        offset=offset,
+        after=after
     )
 
+    has_more = len(content_items) == per_page
     return jsonify({
         'success': True,
         'content': [item.to_dict() for item in content_items],
         'pagination': {
             'page': page,
             'per_page': per_page,
-            'has_more': len(content_items) == per_page
+            'has_more': has_more,
+            'next_cursor': _encode_cursor(content_items[-1]) if has_more else None
         }
     })
 
@@ -225,7 +236,7 @@ async def get_stats():
     """
     Get moderation statistics for the project
     """
-    project_id = request.project.id
+    project_id = request.project_id
 
     stats = await db_service.get_content_counts_by_status(project_id)
     total = stats['total']
@@ -267,6 +278,23 @@ def _is_valid_api_key_format(api_key):
     return re.match(r'^am_[a-zA-Z0-9_-]+$', api_key) is not None
 
 
+def _encode_cursor(content):
+    """Encode the keyset position of a content item as an opaque cursor"""
+    position = f"{content.created_at.isoformat()}|{content.id}"
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """Decode a cursor into a (created_at, id) tuple, or None if it is invalid"""
+    try:
+        created_at, content_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+        if not _is_valid_uuid(content_id):
+            return None
+        return datetime.fromisoformat(created_at), content_id
+    except (ValueError, UnicodeError):
+        return None
+
+
 def _is_valid_uuid(uuid_string):
     """Validate UUID format"""
     if not uuid_string or len(uuid_string) != 36:
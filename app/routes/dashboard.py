@@ -1,7 +1,7 @@
 import secrets
 from datetime import datetime, timedelta
 
-from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
+from flask import Blueprint, abort, flash, jsonify, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload, selectinload
@@ -26,14 +26,19 @@ async def index():
     # Get user projects using centralized service
     projects = await db_service.get_user_projects(current_user.id)
 
-    # Get project statistics
+    # Get project statistics for all projects in one round trip
     total_content = 0
     total_api_keys = 0
 
+    bulk_stats = {}
+    if projects:
+        bulk_stats = await db_service.get_project_bulk_stats(
+            [project.id for project in projects], active_only=True) or {}
+    content_counts = bulk_stats.get('content_counts', {})
+    keys_counts = bulk_stats.get('keys_counts', {})
     for project in projects:
-        stats = await db_service.get_project_stats(project.id)
-        project._content_count = stats.get('total_content', 0)
-        project._api_key_count = stats.get('total_api_keys', 0)
+        project._content_count = content_counts.get(project.id, 0)
+        project._api_key_count = keys_counts.get(project.id, 0)
         total_content += project._content_count
         total_api_keys += project._api_key_count
 
@@ -63,12 +68,18 @@ async def projects():
     # Get user projects using centralized service
     projects = await db_service.get_user_projects(current_user.id)
 
-    # Add project statistics
+    # Add project statistics for all projects in one round trip
+    bulk_stats = {}
+    if projects:
+        bulk_stats = await db_service.get_project_bulk_stats(
+            [project.id for project in projects], active_only=True) or {}
+    content_counts = bulk_stats.get('content_counts', {})
+    keys_counts = bulk_stats.get('keys_counts', {})
+    rules_counts = bulk_stats.get('rules_counts', {})
     for project in projects:
-        stats = await db_service.get_project_stats(project.id)
-        project._content_count = stats.get('total_content', 0)
-        project._api_key_count = stats.get('total_api_keys', 0)
-        project._rules_count = stats.get('total_rules', 0)
+        project._content_count = content_counts.get(project.id, 0)
+        project._api_key_count = keys_counts.get(project.id, 0)
+        project._rules_count = rules_counts.get(project.id, 0)
 
     return render_template('dashboard/projects.html', projects=projects)
 
@@ -115,7 +126,7 @@ async def project_detail(project_id, project=None):
     """Project detail page"""
 
     # Get recent content using database service
-    recent_content = await db_service.get_project_content(project_id, limit=10)
+    recent_content = await db_service.get_project_content_previews(project_id, limit=10)
 
     # Get API keys to avoid DetachedInstanceError in template
     api_keys = await db_service.get_project_api_keys(project_id)
@@ -194,7 +205,7 @@ async def project_rules(project_id, project=None):
 @login_required
 async def create_rule(project_id):
     """Create new moderation rule"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -238,6 +249,7 @@ async def create_rule(project_id):
         )
         db.session.add(rule)
         db.session.commit()
+        db_service.invalidate_rule_cache(project.id)
 
         flash('Moderation rule created successfully!', 'success')
         return redirect(url_for('dashboard.project_rules', project_id=project_id))
@@ -249,7 +261,7 @@ async def create_rule(project_id):
 @login_required
 async def update_rule(project_id, rule_id):
     """Update existing moderation rule"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -287,6 +299,7 @@ async def update_rule(project_id, rule_id):
             }
 
         db.session.commit()
+        db_service.invalidate_rule_cache(project.id)
 
         return jsonify({'success': True, 'message': 'Rule updated successfully'})
 
@@ -299,43 +312,35 @@ async def update_rule(project_id, rule_id):
 @login_required
 async def toggle_rule(project_id, rule_id):
     """Toggle rule active/inactive status"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
         return jsonify({'success': False, 'error': 'Access denied'}), 403
-    rule = ModerationRule.query.filter_by(
-        id=rule_id, project_id=project.id).first_or_404()
 
-    try:
-        data = request.get_json()
-        action = data.get('action')
+    data = request.get_json(silent=True) or {}
+    action = data.get('action')
+    if action not in ('activate', 'deactivate'):
+        return jsonify({'success': False, 'error': 'Invalid action'}), 400
 
-        if action == 'activate':
-            rule.is_active = True
-        elif action == 'deactivate':
-            rule.is_active = False
-        else:
-            return jsonify({'success': False, 'error': 'Invalid action'}), 400
-
-        db.session.commit()
-
-        return jsonify({
-            'success': True,
-            'message': f'Rule {"activated" if action == "activate" else "deactivated"} successfully',
-            'is_active': rule.is_active
-        })
-
-    except Exception:
-        db.session.rollback()
+    updated = await db_service.set_rule_active(project.id, rule_id, action == 'activate')
+    if updated is None:
         return jsonify({'success': False, 'error': 'An error occurred while toggling the rule'}), 400
+    if not updated:
+        abort(404)
+
+    return jsonify({
+        'success': True,
+        'message': f'Rule {"activated" if action == "activate" else "deactivated"} successfully',
+        'is_active': action == 'activate'
+    })
 
 
 @dashboard_bp.route('/projects/<project_id>/rules/<rule_id>/delete', methods=['POST'])
 @login_required
 async def delete_rule(project_id, rule_id):
     """Delete moderation rule"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -347,6 +352,7 @@ async def delete_rule(project_id, rule_id):
         rule_name = rule.name
         db.session.delete(rule)
         db.session.commit()
+        db_service.invalidate_rule_cache(project.id)
 
         return jsonify({
             'success': True,
@@ -362,7 +368,7 @@ async def delete_rule(project_id, rule_id):
 @login_required
 async def project_content(project_id):
     """View project content"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -442,7 +448,7 @@ async def project_content(project_id):
 @login_required
 async def get_content_details(project_id, content_id):
     """Get content details for modal"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -462,43 +468,35 @@ async def get_content_details(project_id, content_id):
 @login_required
 async def toggle_api_key(project_id, key_id):
     """Toggle API key active/inactive status"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
         return jsonify({'success': False, 'error': 'Access denied'}), 403
-    api_key = APIKey.query.filter_by(
-        id=key_id, project_id=project.id).first_or_404()
 
-    try:
-        data = request.get_json()
-        action = data.get('action')
+    data = request.get_json(silent=True) or {}
+    action = data.get('action')
+    if action not in ('activate', 'deactivate'):
+        return jsonify({'success': False, 'error': 'Invalid action'}), 400
 
-        if action == 'activate':
-            api_key.is_active = True
-        elif action == 'deactivate':
-            api_key.is_active = False
-        else:
-            return jsonify({'success': False, 'error': 'Invalid action'}), 400
-
-        db.session.commit()
+    updated = await db_service.set_api_key_active(project.id, key_id, action == 'activate')
+    if updated is None:
+        return jsonify({'success': False, 'error': 'An error occurred while toggling the API key'}), 400
+    if not updated:
+        abort(404)
 
-        return jsonify({
-            'success': True,
-            'message': f'API key {"activated" if action == "activate" else "deactivated"} successfully',
-            'is_active': api_key.is_active
-        })
-
-    except Exception:
-        db.session.rollback()
-        return jsonify({'success': False, 'error': 'An error occurred while creating the API key'}), 400
+    return jsonify({
+        'success': True,
+        'message': f'API key {"activated" if action == "activate" else "deactivated"} successfully',
+        'is_active': action == 'activate'
+    })
 
 
 @dashboard_bp.route('/projects/<project_id>/api-keys/<key_id>/delete', methods=['POST'])
 @login_required
 async def delete_api_key(project_id, key_id):
     """Delete API key"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -508,8 +506,10 @@ async def delete_api_key(project_id, key_id):
 
     try:
         key_name = api_key.name
+        key_value = api_key.key
         db.session.delete(api_key)
         db.session.commit()
+        db_service.invalidate_api_key_cache(key_value=key_value)
 
         return jsonify({
             'success': True,
@@ -525,7 +525,7 @@ async def delete_api_key(project_id, key_id):
 @login_required
 async def project_settings(project_id):
     """Project settings page"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -571,7 +571,7 @@ async def project_settings(project_id):
 @login_required
 async def update_project(project_id):
     """Update project information"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -602,7 +602,7 @@ async def update_project(project_id):
 @login_required
 async def update_discord_settings(project_id):
     """Update Discord notification settings for a project"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has admin access
     if not project.can_manage_members(current_user.id):
@@ -636,7 +636,7 @@ async def test_discord_webhook(project_id):
     """Test Discord webhook configuration"""
     from app.services.notifications.discord_notifier import DiscordNotifier
 
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has admin access
     if not project.can_manage_members(current_user.id):
@@ -675,7 +675,7 @@ async def test_discord_webhook(project_id):
 @login_required
 async def delete_project(project_id):
     """Delete a project"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Only the owner can delete the project
     if project.user_id != current_user.id:
@@ -685,6 +685,9 @@ async def delete_project(project_id):
     # Delete the project (cascade will handle related data)
     db.session.delete(project)
     db.session.commit()
+    db_service.invalidate_api_key_cache(project_id=project_id)
+    db_service.invalidate_membership_cache(project_id=project_id)
+    db_service.invalidate_rule_cache(project_id)
 
     flash('Project deleted successfully!', 'success')
     return redirect(url_for('dashboard.projects'))
@@ -718,7 +721,7 @@ async def project_analytics(project_id, project):
 @login_required
 async def project_members(project_id):
     """Manage project members"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user has access to this project
     if not project.is_member(current_user.id):
@@ -761,7 +764,7 @@ async def project_members(project_id):
 @login_required
 async def invite_member(project_id):
     """Invite a user to the project"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user can manage members
     if not project.can_manage_members(current_user.id):
@@ -816,7 +819,7 @@ async def invite_member(project_id):
 @login_required
 async def cancel_invitation(project_id, invitation_id):
     """Cancel a pending invitation"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user can manage members
     if not project.can_manage_members(current_user.id):
@@ -839,7 +842,7 @@ async def cancel_invitation(project_id, invitation_id):
 @login_required
 async def remove_member(project_id, membership_id):
     """Remove a member from the project"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user can manage members
     if not project.can_manage_members(current_user.id):
@@ -858,9 +861,11 @@ async def remove_member(project_id, membership_id):
 
     # Store username before deletion
     username = membership.user.username
+    member_user_id = membership.user_id
 
     db.session.delete(membership)
     db.session.commit()
+    db_service.invalidate_membership_cache(project_id=project_id, user_id=member_user_id)
 
     flash(f'Member {username} removed from project', 'success')
     return redirect(url_for('dashboard.project_members', project_id=project_id))
@@ -870,7 +875,7 @@ async def remove_member(project_id, membership_id):
 @login_required
 async def update_member_role(project_id, membership_id):
     """Update a member's role"""
-    project = Project.query.filter_by(id=project_id).first_or_404()
+    project = db.get_or_404(Project, project_id)
 
     # Check if user can manage members
     if not project.can_manage_members(current_user.id):
@@ -939,6 +944,7 @@ async def accept_invitation(token):
     invitation.status = 'accepted'
     db.session.add(membership)
     db.session.commit()
+    db_service.invalidate_membership_cache(project_id=project.id, user_id=current_user.id)
 
     flash(
         f'You have successfully joined the project "{project.name}"', 'success')
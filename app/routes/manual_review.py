@@ -19,7 +19,7 @@ async def index(project_id):
     """Manual review dashboard - shows flagged content for specific project"""
     try:
         # Get project and verify access
-        project = Project.query.get_or_404(project_id)
+        project = db.get_or_404(Project, project_id)
 
         if not project.is_member(current_user.id):
             flash('You do not have access to this project', 'error')
@@ -30,22 +30,17 @@ async def index(project_id):
         per_page = 50  # Limit to 50 items per page
 
         # Get flagged content for this project with pagination
-        flagged_content, total_flagged = await db_service.get_flagged_content_for_projects(
+        flagged_content, has_next = await db_service.get_flagged_content_for_projects(
             [project_id], page=page, per_page=per_page)
 
-        # Get additional statistics for this project
-        total_approved = Content.query.filter(
-            Content.project_id == project_id,
-            Content.status == 'approved'
-        ).count()
-        total_rejected = Content.query.filter(
-            Content.project_id == project_id,
-            Content.status == 'rejected'
-        ).count()
+        # Totals come from the maintained per-status counters rather than COUNT queries
+        status_counts = await db_service.get_content_counts_by_status(project_id)
+        total_flagged = status_counts.get('flagged', 0)
+        total_approved = status_counts.get('approved', 0)
+        total_rejected = status_counts.get('rejected', 0)
 
         # Create pagination object
         has_prev = page > 1
-        has_next = len(flagged_content) == per_page
         prev_num = page - 1 if has_prev else None
         next_num = page + 1 if has_next else None
 
@@ -79,13 +74,13 @@ async def review_content(project_id, content_id):
     """Review specific flagged content"""
     try:
         # Verify project access
-        project = Project.query.get_or_404(project_id)
+        project = db.get_or_404(Project, project_id)
         if not project.is_member(current_user.id):
             flash('You do not have access to this project', 'error')
             return redirect(url_for('dashboard.index'))
 
         # Get content and verify it belongs to this project
-        content = Content.query.get_or_404(content_id)
+        content = db.get_or_404(Content, content_id)
         if content.project_id != project_id:
             flash('Content does not belong to this project', 'error')
             return redirect(url_for('manual_review.index', project_id=project_id))
@@ -97,7 +92,7 @@ async def review_content(project_id, content_id):
         # Get API user info if available
         api_user = None
         if content.api_user_id:
-            api_user = APIUser.query.get(content.api_user_id)
+            api_user = db.session.get(APIUser, content.api_user_id)
 
         return render_template('manual_review/review_content.html',
                                content=content,
@@ -116,7 +111,7 @@ async def review_content(project_id, content_id):
 async def make_decision(content_id):
     """Make a manual decision on flagged content"""
     try:
-        content = Content.query.get_or_404(content_id)
+        content = db.get_or_404(Content, content_id)
 
         # Check if user has access to this project
         if not current_user.is_admin and not content.project.is_member(current_user.id):
@@ -151,7 +146,7 @@ async def make_decision(content_id):
 
         # Update API user stats if available
         if content.api_user_id:
-            api_user = APIUser.query.get(content.api_user_id)
+            api_user = db.session.get(APIUser, content.api_user_id)
             if api_user:
                 api_user.update_stats(decision)
 
@@ -192,8 +187,10 @@ async def bulk_decision():
         if not reason.strip():
             return jsonify({'success': False, 'error': 'Reason is required'}), 400
 
-        # Get all content items and validate access
-        content_items = Content.query.filter(Content.id.in_(content_ids)).all()
+        # Get all content items and validate access (projects and memberships batch-loaded)
+        content_items = Content.query.filter(Content.id.in_(content_ids)).options(
+            selectinload(Content.project).selectinload(Project.memberships)
+        ).all()
 
         if len(content_items) != len(content_ids):
             return jsonify({'success': False, 'error': 'Some content items not found'}), 404
@@ -206,6 +203,10 @@ async def bulk_decision():
                     'error': f'Access denied for content in project {content.project.name}'
                 }), 403
 
+        # Batch-load API users for all items in one query instead of one per item
+        api_users_by_id = await db_service.get_api_users_by_ids(
+            [content.api_user_id for content in content_items if content.api_user_id])
+
         processed_count = 0
         failed_items = []
 
@@ -239,10 +240,9 @@ async def bulk_decision():
                 db.session.add(manual_result)
 
                 # Update API user stats if available
-                if content.api_user_id:
-                    api_user = APIUser.query.get(content.api_user_id)
-                    if api_user:
-                        api_user.update_stats(decision)
+                api_user = api_users_by_id.get(content.api_user_id)
+                if api_user:
+                    api_user.update_stats(decision)
 
                 processed_count += 1
 
@@ -288,7 +288,7 @@ async def api_users():
         # Determine which projects to show
         if from_project_id:
             # Show only API users from this specific project
-            from_project = Project.query.get(from_project_id)
+            from_project = db.session.get(Project, from_project_id)
             if from_project and not from_project.is_member(current_user.id):
                 flash('You do not have access to this project', 'error')
                 return redirect(url_for('dashboard.index'))
@@ -300,7 +300,8 @@ async def api_users():
                 user_projects = Project.query.all()
             else:
                 user_projects = [
-                    p for p in Project.query.all() if p.is_member(current_user.id)]
+                    p for p in Project.query.options(selectinload(Project.memberships)).all()
+                    if p.is_member(current_user.id)]
             project_ids = [p.id for p in user_projects]
 
         # Subquery to count content per user
@@ -383,7 +384,7 @@ async def api_user_by_external_id(external_user_id):
         # Determine which projects to search
         if filter_project_id:
             # Search only in the specified project
-            project = Project.query.get(filter_project_id)
+            project = db.session.get(Project, filter_project_id)
             if not project or not project.is_member(current_user.id):
                 flash('You do not have access to this project', 'error')
                 return redirect(url_for('dashboard.index'))
@@ -432,7 +433,7 @@ async def api_user_by_external_id(external_user_id):
 async def api_user_detail(user_id):
     """View detailed information about a specific API user"""
     try:
-        api_user = APIUser.query.get_or_404(user_id)
+        api_user = db.get_or_404(APIUser, user_id)
 
         # Check if user has access to this project
         if not current_user.is_admin and not api_user.project.is_member(current_user.id):
@@ -470,7 +471,7 @@ async def api_user_detail(user_id):
 async def get_api_user_content_details(user_id, content_id):
     """Get content details for modal in API user detail page"""
     try:
-        api_user = APIUser.query.get_or_404(user_id)
+        api_user = db.get_or_404(APIUser, user_id)
 
         # Check if user has access to this project
         if not current_user.is_admin and not api_user.project.is_member(current_user.id):
@@ -497,7 +498,7 @@ async def get_api_user_content_details(user_id, content_id):
 async def delete_user_data(user_id):
     """Delete all data for an API user"""
     try:
-        api_user = APIUser.query.get_or_404(user_id)
+        api_user = db.get_or_404(APIUser, user_id)
 
         # Check if user has permission (admin or project owner)
         if not current_user.is_admin and not api_user.project.is_owner(current_user.id):
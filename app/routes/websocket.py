@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import time
 from typing import Any, Dict
@@ -102,34 +101,23 @@ def handle_join_project(data: Dict[str, Any]) -> None:
         app = current_app._get_current_object()
         user_id = current_user.id  # Get user_id in the main thread context
 
-        def run_async_operations():
-            """Run async database operations in a separate thread with app context"""
-            with app.app_context():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    # Verify user has access to the project (owner or member)
-                    project = loop.run_until_complete(
-                        db_service.get_project_by_id(project_id))
-                    if not project:
-                        return None, f"Project {project_id} not found"
-
-                    # Check if user is owner or member using centralized service
-                    is_member = loop.run_until_complete(
-                        db_service.is_project_member(project_id, user_id))
-                    return project, None if is_member else "Access denied - you are not a member of this project"
-                finally:
-                    loop.close()
-
-        # Use ThreadPoolExecutor for thread-safe async operations
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(run_async_operations)
-            project, error_msg = future.result(timeout=10)  # 10-second timeout
-
-            if error_msg:
-                logger.warning(f"Join project failed for user {current_user.id}: {error_msg}")
-                emit('error', {'message': error_msg})
-                return
+        async def check_project_access():
+            """Run async database operations on the shared executor with app context"""
+            # Verify user has access to the project (owner or member)
+            project = await db_service.get_project_by_id(project_id)
+            if not project:
+                return None, f"Project {project_id} not found"
+
+            # Check if user is owner or member using centralized service
+            is_member = await db_service.is_project_member(project_id, user_id)
+            return project, None if is_member else "Access denied - you are not a member of this project"
+
+        project, error_msg = db_service.run_sync(app, check_project_access, timeout=10)  # 10-second timeout
+
+        if error_msg:
+            logger.warning(f"Join project failed for user {current_user.id}: {error_msg}")
+            emit('error', {'message': error_msg})
+            return
 
         room = f"project_{project_id}"
         join_room(room)
@@ -140,6 +140,8 @@ class ContentListRequest(BaseModel):
     page: int = Field(default=1, ge=1, description="Page number")
     per_page: int = Field(default=50, ge=1, le=100, description="Items per page")
     status: Optional[ModerationStatus] = Field(default=None, description="Filter by status")
+    cursor: Optional[str] = Field(default=None, max_length=200,
+                                  description="Opaque cursor from a previous page's next_cursor (overrides page)")
 
     class Config:
         json_schema_extra = {
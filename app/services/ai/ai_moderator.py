@@ -18,6 +18,8 @@ class AIModerator:
         self.cache = ResultCache()
         # Capture Flask app instance for context propagation in parallel processing
         self.app = current_app._get_current_object()
+        # The app's logger works without an app context, so moderation can run on pool threads that have none
+        self.logger = self.app.logger
         # Load model and token settings from config
         cfg = current_app.config
         self.model_name = cfg.get('OPENAI_CHAT_MODEL', 'gpt-5-2025-08-07')
@@ -45,7 +47,7 @@ class AIModerator:
         try:
             return len(self.tokenizer.encode(text))
         except (UnicodeDecodeError, ValueError, TypeError) as e:
-            current_app.logger.error(f"Token counting error: {str(e)}")
+            self.logger.error(f"Token counting error: {str(e)}")
             # Fallback: rough estimation (1 token ≈ 4 characters)
             return len(text) // 4
 
@@ -82,7 +84,7 @@ Does content violate this rule? JSON only:"""
             max_allowed_prompt = self.model_context_window - self.max_output_tokens - MIN_CONTENT_SPACE - 1000
 
             if prompt_tokens > max_allowed_prompt:
-                current_app.logger.error(
+                self.logger.error(
                     f"Custom prompt is too large: {prompt_tokens} tokens exceeds maximum of {max_allowed_prompt}. "
                     f"This rule cannot be processed."
                 )
@@ -94,7 +96,7 @@ Does content violate this rule? JSON only:"""
 
             # Log large prompts for debugging
             if prompt_tokens > 10000:
-                current_app.logger.warning(
+                self.logger.warning(
                     f"Large custom prompt detected: {prompt_tokens} tokens. "
                     f"This will significantly reduce available content space."
                 )
@@ -301,9 +303,6 @@ Does content violate this rule? JSON only:"""
                     'openai_flagged': False
                 }
 
-            # Check content size and split if necessary
-            content_tokens = self.count_tokens(content)
-
             # STEP 1: If custom prompt is provided, use ONLY custom prompt analysis
             if custom_prompt:
                 # CRITICAL FIX: Hard limit on character count (tiktoken is broken for some content)
@@ -316,7 +315,7 @@ Does content violate this rule? JSON only:"""
                 # Force chunking if content is too large BY CHARACTER COUNT
                 if content_chars > MAX_CHARS_PER_CHUNK:
                     num_chunks = (content_chars // MAX_CHARS_PER_CHUNK) + 1
-                    current_app.logger.debug(
+                    self.logger.debug(
                         f"Chunking content: {content_chars} chars split into {num_chunks} chunks")
 
                     # Split by character count, not tokens
@@ -341,7 +340,7 @@ Does content violate this rule? JSON only:"""
                             # Early exit: if any chunk is rejected, cancel remaining and return immediately
                             if result.get('decision') == 'rejected':
                                 remaining = len(future_to_chunk) - len(chunk_results)
-                                current_app.logger.info(
+                                self.logger.info(
                                     f"Early exit: Chunk rejected, cancelling {remaining} remaining chunks")
 
                                 # Cancel all pending futures
@@ -367,6 +366,8 @@ Does content violate this rule? JSON only:"""
             # Calculate max content tokens for default moderation (no custom prompt)
             max_content_tokens = self.calculate_max_content_tokens()
 
+            # Only the default path chunks by tokens, so only it pays for tokenization
+            content_tokens = self.count_tokens(content)
             if content_tokens <= max_content_tokens:
                 return self._run_enhanced_default_moderation(content)
             else:
@@ -390,7 +391,7 @@ Does content violate this rule? JSON only:"""
                         # Early exit: if any chunk is rejected, cancel remaining and return immediately
                         if result.get('decision') == 'rejected':
                             remaining = len(future_to_chunk) - len(chunk_results)
-                            current_app.logger.info(
+                            self.logger.info(
                                 f"Early exit: Chunk rejected, cancelling {remaining} remaining chunks")
 
                             # Cancel all pending futures
@@ -404,7 +405,7 @@ Does content violate this rule? JSON only:"""
                 return self._combine_chunk_results(chunk_results, len(content))
 
         except (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError) as e:
-            current_app.logger.error(f"OpenAI API connection error after retries: {str(e)}")
+            self.logger.error(f"OpenAI API connection error after retries: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': f'OpenAI API unavailable after retries - approved for manual review. Error: {str(e)[:100]}',
@@ -415,7 +416,7 @@ Does content violate this rule? JSON only:"""
                 'openai_flagged': False
             }
         except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
-            current_app.logger.error(f"OpenAI API error: {str(e)}")
+            self.logger.error(f"OpenAI API error: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': f'OpenAI API error - approved for manual review. Error: {str(e)[:100]}',
@@ -426,7 +427,7 @@ Does content violate this rule? JSON only:"""
                 'openai_flagged': False
             }
         except (ValueError, TypeError, KeyError) as e:
-            current_app.logger.error(f"Data processing error in moderation: {str(e)}")
+            self.logger.error(f"Data processing error in moderation: {str(e)}")
             return {
                 'decision': 'rejected',
                 'reason': f'Content processing error: {str(e)}',
@@ -449,13 +450,13 @@ Does content violate this rule? JSON only:"""
                 if attempt < max_retries - 1:
                     delay = initial_delay * (2 ** attempt)
                     error_type = type(e).__name__
-                    current_app.logger.warning(
+                    self.logger.warning(
                         f"OpenAI API {error_type} (attempt {attempt + 1}/{max_retries}): {str(e)}. "
                         f"Retrying in {delay:.1f}s..."
                     )
                     time.sleep(delay)
                 else:
-                    current_app.logger.error(
+                    self.logger.error(
                         f"OpenAI API failed after {max_retries} attempts: {str(e)}"
                     )
             except (openai.OpenAIError, openai.APIError, openai.RateLimitError):
@@ -542,7 +543,7 @@ Does content violate this rule? JSON only:"""
 
             except json.JSONDecodeError:
                 # Fallback parsing if JSON is malformed - be conservative and approve
-                current_app.logger.warning(f"Malformed JSON from AI: {result_text}")
+                self.logger.warning(f"Malformed JSON from AI: {result_text}")
                 result_lower = result_text.lower()
 
                 # Only reject if there's a clear rejection signal AND high confidence indicators
@@ -575,7 +576,7 @@ Does content violate this rule? JSON only:"""
 
         except (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError) as e:
             # Connection errors after retry - approve with low confidence for manual review
-            current_app.logger.error(f"OpenAI API connection failed in custom prompt after retries: {str(e)}")
+            self.logger.error(f"OpenAI API connection failed in custom prompt after retries: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': f'OpenAI API unavailable after retries - approved for manual review. Error: {str(e)[:100]}',
@@ -587,7 +588,7 @@ Does content violate this rule? JSON only:"""
             }
         except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
             # Other API errors - reject with low confidence for manual review
-            current_app.logger.error(f"OpenAI API error in custom prompt: {str(e)}")
+            self.logger.error(f"OpenAI API error in custom prompt: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': f'OpenAI API error - approved for manual review. Error: {str(e)[:100]}',
@@ -598,7 +599,7 @@ Does content violate this rule? JSON only:"""
                 'openai_flagged': False
             }
         except (ValueError, TypeError, KeyError, json.JSONDecodeError) as e:
-            current_app.logger.error(f"Data processing error in custom prompt: {str(e)}")
+            self.logger.error(f"Data processing error in custom prompt: {str(e)}")
             return {
                 'decision': 'rejected',
                 'reason': f'Content processing error: {str(e)}',
@@ -673,7 +674,7 @@ Does content violate this rule? JSON only:"""
 
         except (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError) as e:
             # Connection errors after retry - continue to next moderation layer
-            current_app.logger.warning(f"OpenAI baseline moderation unavailable after retries: {str(e)}")
+            self.logger.warning(f"OpenAI baseline moderation unavailable after retries: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': 'OpenAI baseline moderation unavailable - continuing to next check',
@@ -685,7 +686,7 @@ Does content violate this rule? JSON only:"""
             }
         except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
             # Other API errors - continue to next moderation layer
-            current_app.logger.warning(f"OpenAI baseline moderation error: {str(e)}")
+            self.logger.warning(f"OpenAI baseline moderation error: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': 'OpenAI baseline moderation error - continuing to next check',
@@ -696,7 +697,7 @@ Does content violate this rule? JSON only:"""
                 'openai_flagged': False
             }
         except (ValueError, TypeError, AttributeError) as e:
-            current_app.logger.error(f"Data processing error in baseline moderation: {str(e)}")
+            self.logger.error(f"Data processing error in baseline moderation: {str(e)}")
             return {
                 'decision': 'rejected',
                 'reason': f'Content processing error: {str(e)}',
@@ -794,7 +795,7 @@ Is this harmful? JSON only:"""
 
         except (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError) as e:
             # Connection errors after retry - approve with low confidence for manual review
-            current_app.logger.error(f"OpenAI enhanced moderation unavailable after retries: {str(e)}")
+            self.logger.error(f"OpenAI enhanced moderation unavailable after retries: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': f'OpenAI API unavailable after retries - approved for manual review. Error: {str(e)[:100]}',
@@ -806,7 +807,7 @@ Is this harmful? JSON only:"""
             }
         except (openai.OpenAIError, openai.APIError, openai.RateLimitError) as e:
             # Other API errors - approve with low confidence for manual review
-            current_app.logger.error(f"OpenAI API error in enhanced moderation: {str(e)}")
+            self.logger.error(f"OpenAI API error in enhanced moderation: {str(e)}")
             return {
                 'decision': 'approved',
                 'reason': f'OpenAI API error - approved for manual review. Error: {str(e)[:100]}',
@@ -817,7 +818,7 @@ Is this harmful? JSON only:"""
                 'openai_flagged': False
             }
         except (ValueError, TypeError, KeyError, json.JSONDecodeError) as e:
-            current_app.logger.error(f"Data processing error in enhanced moderation: {str(e)}")
+            self.logger.error(f"Data processing error in enhanced moderation: {str(e)}")
             return {
                 'decision': 'rejected',
                 'reason': f'Content processing error: {str(e)}',
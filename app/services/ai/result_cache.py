@@ -1,8 +1,17 @@
 import hashlib
+import logging
+import threading
 import time
+from functools import lru_cache
 from threading import RLock
 
-from flask import current_app
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def _prompt_tag(custom_prompt):
+    """Short, memoized hash of a custom prompt used in cache keys"""
+    return hashlib.md5(custom_prompt.encode('utf-8'), usedforsecurity=False).hexdigest()[:8]
 
 
 class ResultCache:
@@ -17,14 +26,26 @@ class ResultCache:
     _cleanup_threshold = 45000  # Start cleanup when reaching 90% capacity
     _last_cleanup_time = 0
     _cleanup_interval = 900  # Check for expired entries every 15 minutes
+    _janitor_interval = 60  # Background janitor wake-up interval
+    _janitor_started = False
+    _needs_cleanup = False  # Set by the request path when the cleanup threshold is reached
+    _short_content_limit = 256  # Content shorter than this is used as its own key
 
     def __init__(self, cache_ttl=3600):  # 1 hour default
         self._cache_ttl = cache_ttl
         # Use class-level shared cache instead of instance cache
         ResultCache._shared_cache_ttl = cache_ttl
+        if not ResultCache._janitor_started:
+            ResultCache._start_janitor()
 
     def generate_cache_key(self, content, custom_prompt=None):
         """Generate a cache key based on content hash and prompt for better performance"""
+        prompt_tag = _prompt_tag(custom_prompt) if custom_prompt else "enhanced_default"
+
+        # Short content is a perfectly good dict key on its own; skip hashlib entirely
+        if len(content) < ResultCache._short_content_limit:
+            return ("S", content, prompt_tag)
+
         # Use content hash for large content to avoid memory issues
         if len(content) > 1000:
             content_hash = hashlib.md5(content.encode(
@@ -33,35 +54,25 @@ class ResultCache:
         else:
             combined = content
 
-        if custom_prompt:
-            prompt_hash = hashlib.md5(custom_prompt.encode(
-                'utf-8'), usedforsecurity=False).hexdigest()[:8]
-            combined = f"{combined}|{prompt_hash}"
-        else:
-            combined = f"{combined}|enhanced_default"
+        combined = f"{combined}|{prompt_tag}"
 
         return hashlib.md5(combined.encode('utf-8'), usedforsecurity=False).hexdigest()
 
     def get_cached_result(self, cache_key):
         """Get cached result if it exists and is not expired (thread-safe)"""
         with ResultCache._cache_lock:
-            # Perform periodic cleanup
-            self._periodic_cleanup()
-
             if cache_key in ResultCache._shared_cache:
                 cached_data = ResultCache._shared_cache[cache_key]
                 if time.time() - cached_data['timestamp'] < ResultCache._shared_cache_ttl:
                     # Cache hit - only log occasionally to reduce noise
                     if len(ResultCache._shared_cache) <= 5:
-                        current_app.logger.info("Cache HIT")
+                        logger.info("Cache HIT")
                     return cached_data['result']
                 else:
                     # Remove expired cache entry immediately
                     try:
                         del ResultCache._shared_cache[cache_key]
-                        if current_app.logger.level <= 10:
-                            current_app.logger.info(
-                                f"Cache EXPIRED for key: {cache_key[:8]}...")
+                        logger.debug("Cache EXPIRED for key: %.8s...", cache_key)
                     except KeyError:
                         pass  # Already removed by another thread
             return None
@@ -69,11 +80,7 @@ class ResultCache:
     def cache_result(self, cache_key, result):
         """Cache the result with timestamp (thread-safe with memory leak prevention)"""
         with ResultCache._cache_lock:
-            # Check if cache is at capacity before adding
-            if len(ResultCache._shared_cache) >= ResultCache._max_cache_size:
-                self._aggressive_cleanup()
-
-            # Only cache if we have space or successfully cleaned up
+            # Only cache if we have space; expired entries are reclaimed by the janitor thread
             if len(ResultCache._shared_cache) < ResultCache._max_cache_size:
                 ResultCache._shared_cache[cache_key] = {
                     'result': result,
@@ -84,11 +91,11 @@ class ResultCache:
                 ResultCache._current_request_stores += 1
             else:
                 # Cache is full, log warning
-                current_app.logger.warning("Cache full, dropping new entry to prevent memory leak")
+                logger.warning("Cache full, dropping new entry to prevent memory leak")
 
-            # Perform cleanup if we've reached the threshold
+            # Ask the janitor for an early sweep once we've reached the threshold
             if len(ResultCache._shared_cache) >= ResultCache._cleanup_threshold:
-                self._cleanup_expired_entries()
+                ResultCache._needs_cleanup = True
 
     def get_request_cache_summary(self):
         """Get summary of cache operations for current request"""
@@ -104,7 +111,7 @@ class ResultCache:
                 ResultCache._shared_cache.pop(cache_key, None)
             else:
                 ResultCache._shared_cache.clear()
-                current_app.logger.info("Cache cleared completely")
+                logger.info("Cache cleared completely")
 
     def get_cache_stats(self):
         """Get cache statistics for monitoring"""
@@ -120,56 +127,56 @@ class ResultCache:
             'oldest_entry_age': self._get_oldest_entry_age()
         }
 
-    def _periodic_cleanup(self):
-        """Perform periodic cleanup to prevent memory leaks"""
-        current_time = time.time()
-        if current_time - ResultCache._last_cleanup_time > ResultCache._cleanup_interval:
-            self._cleanup_expired_entries()
-            ResultCache._last_cleanup_time = current_time
-
-    def _cleanup_expired_entries(self):
-        """Remove expired entries from cache"""
-        current_time = time.time()
-        expired_keys = []
-
-        for key, data in list(ResultCache._shared_cache.items()):
-            if current_time - data['timestamp'] >= ResultCache._shared_cache_ttl:
-                expired_keys.append(key)
-
-        # Remove expired entries
-        for key in expired_keys:
-            ResultCache._shared_cache.pop(key, None)
+    @classmethod
+    def _start_janitor(cls):
+        """Start the background cleanup thread once per process"""
+        with cls._cache_lock:
+            if cls._janitor_started:
+                return
+            cls._janitor_started = True
+        threading.Thread(target=cls._janitor, name='result-cache-janitor', daemon=True).start()
+
+    @classmethod
+    def _janitor(cls):
+        """Background loop that keeps expensive cache scans off the request path"""
+        while True:
+            time.sleep(cls._janitor_interval)
+            try:
+                current_time = time.time()
+                if cls._needs_cleanup or current_time - cls._last_cleanup_time > cls._cleanup_interval:
+                    cls._needs_cleanup = False
+                    cls._last_cleanup_time = current_time
+                    cls._cleanup_expired_entries()
+            except Exception as e:
+                logger.error("Result cache cleanup failed: %s", e)
+
+    @classmethod
+    def _cleanup_expired_entries(cls):
+        """Remove expired entries from cache (only ever removes entries older than the TTL)"""
+        with cls._cache_lock:
+            current_time = time.time()
+            ttl = cls._shared_cache_ttl
+
+            # Iterate the dict directly under the lock and only collect the
+            # expired keys; deletion happens after the scan
+            expired_keys = [key for key, data in cls._shared_cache.items()
+                            if current_time - data['timestamp'] >= ttl]
+
+            # Remove expired entries
+            for key in expired_keys:
+                cls._shared_cache.pop(key, None)
+
+            remaining = len(cls._shared_cache)
 
         if expired_keys:
-            current_app.logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
-
-    def _aggressive_cleanup(self):
-        """Perform aggressive cleanup when cache is full - ONLY remove expired entries"""
-        current_time = time.time()
-        entries_to_remove = []
-
-        # ONLY remove entries that are actually expired (>= 1 hour old)
-        # This guarantees all entries last at least the full TTL
-        for key, data in list(ResultCache._shared_cache.items()):
-            if current_time - data['timestamp'] >= ResultCache._shared_cache_ttl:
-                entries_to_remove.append((key, data['timestamp']))
-
-        # If no expired entries and cache is full, log warning but don't remove valid entries
-        if not entries_to_remove:
-            current_app.logger.warning(
-                f"Cache full at {len(ResultCache._shared_cache)} entries with no expired entries. "
-                "Consider increasing max_cache_size or reducing TTL."
+            logger.info("Cleaned up %d expired cache entries", len(expired_keys))
+        if remaining >= cls._max_cache_size:
+            # Valid entries are never evicted early, so a full cache can only shrink as entries expire
+            logger.warning(
+                "Cache full at %d entries with no expired entries. "
+                "Consider increasing max_cache_size or reducing TTL.",
+                remaining
             )
-            return
-
-        # Remove the entries (increased limit from 500 to 1000 for larger cache)
-        removed_count = 0
-        for key, _ in entries_to_remove[:1000]:  # Limit to prevent blocking
-            if ResultCache._shared_cache.pop(key, None) is not None:
-                removed_count += 1
-
-        if removed_count > 0:
-            current_app.logger.info(f"Aggressive cleanup: removed {removed_count} cache entries")
 
     def _estimate_cache_size(self):
         """Rough estimate of cache size in MB"""
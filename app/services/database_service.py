@@ -4,133 +4,339 @@ High-performance async database operations with consistent error handling
 """
 
 import asyncio
+import atexit
 import logging
+import os
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from flask import current_app, g, has_app_context
+from sqlalchemy import and_, bindparam, case, exists, func, insert, inspect, literal, or_, select, tuple_, union_all, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from werkzeug.security import generate_password_hash
 
 from app import db
 from app.models.api_key import APIKey
 from app.models.api_user import APIUser
 from app.models.content import Content
+from app.models.content_counter import ContentStatusCount, ModerationDecisionCount, record_decisions, record_status_change
 from app.models.moderation_result import ModerationResult
 from app.models.moderation_rule import ModerationRule
 from app.models.project import Project, ProjectMember
 from app.models.user import User
+from app.services.moderation.rule_cache import CachedRuleSet, rule_cache
+from config.config import Config
 
 logger = logging.getLogger(__name__)
 
+# One process-wide pool for sync <-> async bridging, instead of one per caller
+_executor = ThreadPoolExecutor(max_workers=Config.DB_THREAD_POOL_WORKERS, thread_name_prefix='db')
+
+# Password hashing is CPU-bound (hashlib releases the GIL), so it gets its own CPU-sized pool
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='password-hash')
+
+
+# Mapped attributes update_content_status may write (callers pass attribute names, not column
+# names); identity and ownership columns are never updated
+_CONTENT_UPDATABLE_COLUMNS = frozenset(
+    attr.key for attr in Content.__mapper__.column_attrs if attr.key not in ('id', 'project_id', 'created_at'))
+
+# Per-decision counter column on APIUser (mirrors APIUser.update_stats)
+_API_USER_DECISION_COUNTERS = {
+    'approved': APIUser.approved_count,
+    'rejected': APIUser.rejected_count,
+    'flagged': APIUser.flagged_count,
+}
+
+# Hot single-row statements, built once with bind parameters instead of per call. Executions then
+# go straight to the engine's compiled-statement cache (query_cache_size) with new parameters.
+_API_KEY_LOOKUP = select(
+    APIKey.id, APIKey.key, APIKey.name, APIKey.project_id, APIKey.is_active
+).where(APIKey.key == bindparam('key_value'), APIKey.is_active.is_(True)).limit(1)
+
+_project_id_param = bindparam('project_id')
+_user_id_param = bindparam('user_id')
+_MEMBERSHIP_CHECK = select(or_(
+    exists().where(and_(Project.id == _project_id_param, Project.user_id == _user_id_param)),
+    exists().where(and_(ProjectMember.project_id == _project_id_param, ProjectMember.user_id == _user_id_param))
+))
+
+_CONTENT_STATUS_LOOKUP = select(Content.project_id, Content.status).where(Content.id == bindparam('content_id'))
+_CONTENT_UPDATE = update(Content).where(Content.id == bindparam('content_id'))
+
+
+def _strict_loading(*options):
+    """Eager-load options, plus raiseload('*') when DB_RAISE_ON_LAZY_LOAD is enabled
+
+    Use for queries whose callers only touch the relationships loaded here.
+    """
+    if current_app.config.get('DB_RAISE_ON_LAZY_LOAD'):
+        return (*options, raiseload('*'))
+    return options
+
+
+def _log_database_error(error, label="Database error"):
+    """Log a SQLAlchemy error; the rendered statement and parameters only at DEBUG"""
+    # str() of a StatementError renders the full SQL and bound parameters, so the
+    # error line carries only the DBAPI message
+    logger.error("%s: %s", label, getattr(error, 'orig', None) or error)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s details: %s", label, error)
+
+
+def _count_if(condition):
+    """Conditional COUNT for aggregating several counts in a single table scan
+
+    Renders as ``COUNT(*) FILTER (WHERE ...)``, supported by PostgreSQL and SQLite 3.30+.
+    """
+    return func.count().filter(condition)
+
+
+@dataclass(frozen=True)
+class APIKeySnapshot:
+    """Immutable copy of an API key's identifying fields, safe to share across requests"""
+    id: str
+    key: str
+    name: str
+    project_id: str
+    is_active: bool
+
+
+@dataclass(slots=True)
+class ContentSnapshot:
+    """Plain copy of a content row for the moderation pipeline
+
+    The pipeline hands content to AI worker threads and websocket notifier threads, so it
+    must not carry a live ORM instance bound to the request's session.
+    """
+    id: str
+    project_id: str
+    content_type: str
+    content_data: str
+    meta_data: Optional[dict]
+    status: str
+    api_user_id: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class _TTLCache:
+    """Small thread-safe in-process cache with per-entry expiry for hot lookups"""
+
+    def __init__(self, ttl: float, max_size: int):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (hit, value) for a key, dropping it if expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if time.monotonic() >= entry[1]:
+                del self._entries[key]
+                return False, None
+            return True, entry[0]
+
+    def set(self, key, value):
+        """Store a value, evicting the oldest entry when full"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._max_size:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (value, time.monotonic() + self._ttl)
+
+    def pop(self, key):
+        """Invalidate a single key"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Any, Any], bool]):
+        """Invalidate every entry whose (key, value) matches the predicate"""
+        with self._lock:
+            for key in [k for k, (v, _) in self._entries.items() if predicate(k, v)]:
+                del self._entries[key]
+
+
+class _UsageBuffer:
+    """Coalesces API key usage increments in memory and flushes them in periodic batches
+
+    The request path only bumps an in-memory counter; a daemon thread writes the
+    accumulated deltas with one executemany UPDATE per interval, so usage_count and
+    last_used lag by at most one interval.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._pending = {}  # api_key_id -> [delta, last_used]
+        self._lock = threading.Lock()
+        self._app = None
+
+    def record(self, api_key_id: str, app) -> None:
+        with self._lock:
+            entry = self._pending.setdefault(api_key_id, [0, None])
+            entry[0] += 1
+            entry[1] = datetime.utcnow()
+            if self._app is None:
+                self._app = app
+                threading.Thread(target=self._run, name='api-key-usage-flush', daemon=True).start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            try:
+                self.flush()
+            except Exception:
+                # Never let one bad flush end the thread; usage would then pile up unwritten
+                logger.exception("API key usage flush failed")
+
+    def flush(self) -> None:
+        """Write pending deltas; on failure they are merged back for the next attempt"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending or self._app is None:
+            return
+
+        stmt = update(APIKey).where(APIKey.id == bindparam('key_id')).values(
+            usage_count=func.coalesce(APIKey.usage_count, 0) + bindparam('delta'),
+            last_used=bindparam('used_at'))
+        params = [{'key_id': key_id, 'delta': delta, 'used_at': used_at}
+                  for key_id, (delta, used_at) in pending.items()]
+        try:
+            with self._app.app_context():
+                db.session.connection().execute(stmt, params)
+                db.session.commit()
+        except Exception as e:
+            if isinstance(e, SQLAlchemyError):
+                _log_database_error(e, "API key usage flush failed")
+            else:
+                logger.exception("API key usage flush failed")
+            with self._lock:
+                for key_id, (delta, used_at) in pending.items():
+                    entry = self._pending.setdefault(key_id, [0, used_at])
+                    entry[0] += delta
+                    entry[1] = max(entry[1] or used_at, used_at)
+
 
 class DatabaseService:
     """Async centralized database operations with consistent error handling"""
 
     def __init__(self):
-        from flask import current_app
-        try:
-            max_workers = current_app.config.get('DB_THREAD_POOL_WORKERS', 8)
-        except RuntimeError:
-            # No app context available during initialization
-            max_workers = 8
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
-        self._operation_lock = threading.RLock()  # Reentrant lock for thread safety
+        self._executor = _executor
+        # Hot authorization lookups, invalidated from the routes that change them
+        self._api_key_cache = _TTLCache(ttl=60, max_size=10000)
+        # Short-lived negative entries, so repeated unknown/invalid keys don't each cost a query
+        self._api_key_miss_cache = _TTLCache(ttl=10, max_size=10000)
+        self._membership_cache = _TTLCache(ttl=60, max_size=10000)
+        # Admin dashboard widgets: a few seconds of staleness turns every render into one query per TTL
+        self._dashboard_cache = _TTLCache(ttl=10, max_size=64)
+        self._usage_buffer = _UsageBuffer(interval=Config.API_KEY_USAGE_FLUSH_INTERVAL)
 
     async def _safe_execute(self, operation_func, *args, **kwargs):
-        """Execute database operation asynchronously in thread pool with proper synchronization"""
-        from flask import current_app, has_app_context
-
-        loop = asyncio.get_event_loop()
-
-        # If we have an app context, we need to preserve it for the thread pool
-        if has_app_context():
-            app = current_app._get_current_object()
-
-            def context_operation():
-                # Use thread-safe operation with locking
-                with self._operation_lock:
-                    with app.app_context():
-                        try:
-                            result = operation_func(*args, **kwargs)
-                            # Ensure session is properly handled
-                            if hasattr(db.session, 'commit'):
-                                # Session will be committed by the operation if needed
-                                pass
-                            return result
-                        except SQLAlchemyError as e:
-                            logger.error(f"Database error in thread: {str(e)}")
-                            try:
-                                db.session.rollback()
-                            except SQLAlchemyError as rollback_error:
-                                logger.error(f"Rollback error: {str(rollback_error)}")
-                            raise
-                        except (ValueError, TypeError, AttributeError) as e:
-                            logger.error(f"Data processing error in thread: {str(e)}")
-                            try:
-                                db.session.rollback()
-                            except SQLAlchemyError as rollback_error:
-                                logger.error(f"Rollback error: {str(rollback_error)}")
-                            raise
+        """Execute database operation on the caller's request-scoped session
 
-            try:
-                return await loop.run_in_executor(self._executor, context_operation)
-            except SQLAlchemyError as e:
-                logger.error(f"Database error: {str(e)}")
-                return None
-            except (ValueError, TypeError, RuntimeError) as e:
-                logger.error(f"Runtime error: {str(e)}")
-                return None
-        else:
-            # No app context, run directly (shouldn't happen in normal operation)
-            def safe_operation():
-                with self._operation_lock:
-                    try:
-                        return operation_func(*args, **kwargs)
-                    except SQLAlchemyError as e:
-                        logger.error(f"Database error (no context): {str(e)}")
-                        try:
-                            db.session.rollback()
-                        except SQLAlchemyError:
-                            pass
-                        raise
-                    except (ValueError, TypeError, AttributeError) as e:
-                        logger.error(f"Data processing error (no context): {str(e)}")
-                        raise
+        This is the single rollback path for service operations: a failing operation is
+        rolled back here, on the same thread and session that raised, so operations do
+        not need their own try/rollback blocks. Inside ``transaction()`` errors are logged
+        and re-raised instead, so the whole unit is rolled back by the context manager.
+        """
+        if not has_app_context():
+            # db.session is bound to the app context, so there is nothing to run the operation
+            # on; sync callers without a context should go through run_sync(app, ...)
+            logger.error("Database operation %s called outside an app context",
+                         getattr(operation_func, '__qualname__', operation_func))
+            return None
+
+        # Run inline on the session bound to the current app context. This avoids a thread
+        # hop and an app context push per query, and errors are rolled back on the same
+        # session (and connection) that raised them.
+        try:
+            return operation_func(*args, **kwargs)
+        except SQLAlchemyError as e:
+            _log_database_error(e)
+            if g.get('_db_transaction_depth'):
+                raise
+            self._rollback_session()
+            return None
+        except (ValueError, TypeError) as e:
+            logger.error("Data processing error: %s", e)
+            if g.get('_db_transaction_depth'):
+                raise
+            self._rollback_session()
+            return None
+        except AttributeError as e:
+            logger.error("Data processing error: %s", e)
+            if not g.get('_db_transaction_depth'):
+                self._rollback_session()
+            raise
+        except RuntimeError as e:
+            logger.error("Runtime error: %s", e)
+            if g.get('_db_transaction_depth'):
+                raise
+            return None
+
+    def run_sync(self, app, coroutine_func, *args, timeout: Optional[float] = None, **kwargs):
+        """Run a database coroutine from sync code inside an app context
 
+        When the caller already has this app's context and no event loop is running on
+        its thread, the coroutine runs inline on the caller's session; otherwise it runs
+        on the shared executor under a freshly pushed app context. A timeout always uses
+        the executor so it can be enforced.
+        """
+        if timeout is None and has_app_context() and current_app._get_current_object() is app:
             try:
-                return await loop.run_in_executor(self._executor, safe_operation)
-            except SQLAlchemyError as e:
-                logger.error(f"Database error: {str(e)}")
-                return None
-            except (ValueError, TypeError, RuntimeError) as e:
-                logger.error(f"Runtime error: {str(e)}")
-                return None
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop on this thread: skip the thread hop and app context push/teardown
+                return asyncio.run(coroutine_func(*args, **kwargs))
+
+        def _run():
+            with app.app_context():
+                return asyncio.run(coroutine_func(*args, **kwargs))
+
+        return self._executor.submit(_run).result(timeout=timeout)
+
+    def _rollback_session(self):
+        """Roll back the current session, logging (not raising) rollback failures"""
+        try:
+            db.session.rollback()
+        except SQLAlchemyError as rollback_error:
+            logger.error("Rollback error: %s", rollback_error)
+
+    @staticmethod
+    async def _hash_password(password: str) -> str:
+        """Hash a password on the CPU pool, outside any database transaction"""
+        return await asyncio.wrap_future(_hash_executor.submit(generate_password_hash, password))
 
     # User Operations
     async def create_user(self, username: str, email: str, password: str,
                           is_admin: bool = False, is_active: bool = True) -> Optional[User]:
         """Create a new user"""
+        password_hash = await self._hash_password(password)
+
         def _create_user():
-            try:
-                user = User(username=username, email=email, is_admin=is_admin, is_active=is_active)
-                user.set_password(password)
-                db.session.add(user)
-                db.session.commit()
-                # Refresh the user to ensure it's attached to the session
-                db.session.refresh(user)
-                return user
-            except SQLAlchemyError:
-                db.session.rollback()
-                raise
+            user = User(username=username, email=email, is_admin=is_admin, is_active=is_active,
+                        password_hash=password_hash)
+            db.session.add(user)
+            db.session.commit()
+            # Refresh the user to ensure it's attached to the session
+            db.session.refresh(user)
+            return user
 
         return await self._safe_execute(_create_user)
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email address"""
         def _get_user():
-            return User.query.filter_by(email=email).first()
+            return db.session.execute(select(User).where(User.email == email).limit(1)).scalars().first()
 
         return await self._safe_execute(_get_user)
 
@@ -152,50 +358,44 @@ class DatabaseService:
                                  is_admin: bool = False, is_active: bool = True) -> Optional[User]:
         """Create a new user with Google SSO (no password)"""
         def _create_user():
-            try:
-                user = User(username=username, email=email, google_id=google_id,
-                            is_admin=is_admin, is_active=is_active)
-                db.session.add(user)
-                db.session.commit()
-                db.session.refresh(user)
-                return user
-            except SQLAlchemyError:
-                db.session.rollback()
-                raise
+            user = User(username=username, email=email, google_id=google_id,
+                        is_admin=is_admin, is_active=is_active)
+            db.session.add(user)
+            db.session.commit()
+            db.session.refresh(user)
+            return user
 
         return await self._safe_execute(_create_user)
 
     async def link_google_account(self, user_id: str, google_id: str) -> bool:
         """Link Google account to existing user"""
         def _link_account():
-            try:
-                user = User.query.get(user_id)
-                if not user:
-                    return False
-                user.google_id = google_id
-                db.session.commit()
-                return True
-            except SQLAlchemyError:
-                db.session.rollback()
-                raise
+            # Conditional UPDATE: the affected row count doubles as the existence check
+            rowcount = db.session.execute(
+                update(User).where(User.id == user_id).values(google_id=google_id)
+            ).rowcount
+            db.session.commit()
+            return rowcount > 0
 
         return await self._safe_execute(_link_account)
 
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
         def _get_user():
-            return User.query.get(user_id)
+            return db.session.get(User, user_id)
 
         return await self._safe_execute(_get_user)
 
     async def get_user_with_projects(self, user_id: str) -> Optional[User]:
         """Get user by ID with projects and related data loaded (DEPRECATED - causes OOM with large datasets)"""
         def _get_user():
+            # selectinload keeps each collection to one IN query instead of a
+            # projects x api_keys x content cartesian join
             return User.query.options(
-                joinedload(User.projects)
-                .joinedload(Project.api_keys),
-                joinedload(User.projects)
-                .joinedload(Project.content)
+                selectinload(User.projects)
+                .selectinload(Project.api_keys),
+                selectinload(User.projects)
+                .selectinload(Project.content)
             ).filter_by(id=user_id).first()
 
         return await self._safe_execute(_get_user)
@@ -203,25 +403,33 @@ class DatabaseService:
     async def get_user_with_project_stats(self, user_id: str) -> Optional[dict]:
         """Get user with lightweight project statistics for profile page"""
         def _get_user_stats():
-            from sqlalchemy import func
-
             # Get basic user info
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             if not user:
                 return None
 
-            # Get project stats efficiently with aggregated counts
+            # Per-project counts as grouped derived tables joined once, rather than joining
+            # api_keys and content together (a keys x content row explosion per project that
+            # COUNT(DISTINCT) then has to collapse); content totals come from the counters
+            user_project_ids = select(Project.id).where(Project.user_id == user_id)
+            keys_counts = select(
+                APIKey.project_id, func.count(APIKey.id).label('n')
+            ).where(APIKey.project_id.in_(user_project_ids)).group_by(APIKey.project_id).subquery()
+            content_counts = select(
+                ContentStatusCount.project_id, func.sum(ContentStatusCount.count).label('n')
+            ).where(ContentStatusCount.project_id.in_(user_project_ids)).group_by(
+                ContentStatusCount.project_id).subquery()
+
             project_stats = db.session.query(
                 Project.id,
                 Project.name,
                 Project.description,
                 Project.created_at,
-                func.count(APIKey.id.distinct()).label('api_key_count'),
-                func.count(Content.id.distinct()).label('content_count')
-            ).outerjoin(APIKey, Project.id == APIKey.project_id)\
-             .outerjoin(Content, Project.id == Content.project_id)\
+                func.coalesce(keys_counts.c.n, 0).label('api_key_count'),
+                func.coalesce(content_counts.c.n, 0).label('content_count')
+            ).outerjoin(keys_counts, keys_counts.c.project_id == Project.id)\
+             .outerjoin(content_counts, content_counts.c.project_id == Project.id)\
              .filter(Project.user_id == user_id)\
-             .group_by(Project.id, Project.name, Project.description, Project.created_at)\
              .all()
 
             # Build user dict with stats (keep datetime objects for template)
@@ -278,50 +486,49 @@ class DatabaseService:
     async def toggle_user_admin_status(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Toggle admin status for a user"""
         def _toggle_admin():
-            user = User.query.get(user_id)
-            if not user:
+            # Flip the flag in a single UPDATE ... RETURNING: one round trip, no lost update
+            row = db.session.execute(
+                update(User).where(User.id == user_id)
+                # The column is nullable and NOT NULL is NULL; treat NULL as False like the old Python toggle
+                .values(is_admin=~func.coalesce(User.is_admin, False))
+                .returning(User.id, User.username, User.email, User.is_admin, User.is_active)
+            ).first()
+            if not row:
                 return None
-            user.is_admin = not user.is_admin
             db.session.commit()
-            # Return the needed data as a dictionary to avoid detached instance issues
-            return {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'is_admin': user.is_admin,
-                'is_active': user.is_active
-            }
+            return dict(row._mapping)
 
         return await self._safe_execute(_toggle_admin)
 
     async def toggle_user_active_status(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Toggle active status for a user"""
         def _toggle_active():
-            user = User.query.get(user_id)
-            if not user:
+            # Flip the flag in a single UPDATE ... RETURNING: one round trip, no lost update
+            row = db.session.execute(
+                update(User).where(User.id == user_id)
+                # The column is nullable and NOT NULL is NULL; treat NULL as active, like the column default
+                .values(is_active=~func.coalesce(User.is_active, True))
+                .returning(User.id, User.username, User.email, User.is_admin, User.is_active)
+            ).first()
+            if not row:
                 return None
-            user.is_active = not user.is_active
             db.session.commit()
-            # Return the needed data as a dictionary to avoid detached instance issues
-            return {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'is_admin': user.is_admin,
-                'is_active': user.is_active
-            }
+            return dict(row._mapping)
 
         return await self._safe_execute(_toggle_active)
 
     async def update_user_password(self, user_id: str, new_password: str) -> bool:
         """Update user password"""
+        password_hash = await self._hash_password(new_password)
+
         def _update_password():
-            user = User.query.get(user_id)
-            if not user:
-                return False
-            user.set_password(new_password)
+            # Conditional UPDATE: the affected row count doubles as the existence check
+            rowcount = db.session.execute(
+                update(User).where(User.id == user_id)
+                .values(password_hash=password_hash)
+            ).rowcount
             db.session.commit()
-            return True
+            return rowcount > 0
 
         result = await self._safe_execute(_update_password)
         return result is not None and result is not False
@@ -350,29 +557,31 @@ class DatabaseService:
     async def get_user_projects(self, user_id: str) -> List[Project]:
         """Get all projects accessible to a user (owned + member)"""
         def _get_projects():
-            owned_project_ids = db.session.query(
-                Project.id).filter_by(user_id=user_id)
-            member_project_ids = db.session.query(Project.id).join(ProjectMember).filter(
-                ProjectMember.user_id == user_id
-            )
-            all_project_ids = owned_project_ids.union(member_project_ids)
-            return Project.query.filter(Project.id.in_(all_project_ids)).all()
+            # Single query: only the user's own membership row is joined, so each
+            # project appears once without a UNION/IN subquery or DISTINCT
+            return Project.query.outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Project.id, ProjectMember.user_id == user_id)
+            ).filter(
+                or_(Project.user_id == user_id, ProjectMember.id.isnot(None))
+            ).all()
 
         return await self._safe_execute(_get_projects) or []
 
     async def get_project_by_id(self, project_id: str) -> Optional[Project]:
         """Get project by ID with owner relationship loaded"""
         def _get_project():
-            return Project.query.options(
-                joinedload(Project.owner)
-            ).filter_by(id=project_id).first()
+            # Primary-key lookup: served from the identity map when already loaded this request
+            return db.session.get(Project, project_id, options=[joinedload(Project.owner)])
 
         return await self._safe_execute(_get_project)
 
     async def get_project_by_id_secure(self, project_id: str) -> Optional[Project]:
-        """Get project by ID with 404 handling"""
+        """Get project by ID, or None if it does not exist (callers abort(404) themselves)"""
         def _get_project():
-            return Project.query.filter_by(id=project_id).first_or_404()
+            # No first_or_404 here: abort() from the service layer would be swallowed by
+            # _safe_execute or raised outside a request context
+            return db.session.get(Project, project_id)
 
         return await self._safe_execute(_get_project)
 
@@ -390,35 +599,40 @@ class DatabaseService:
 
     async def delete_project(self, project: Project) -> bool:
         """Delete a project"""
+        project_id = project.id
+
         def _delete_project():
             db.session.delete(project)
             db.session.commit()
             return True
 
         result = await self._safe_execute(_delete_project)
+        if result is not None:
+            self.invalidate_api_key_cache(project_id=project_id)
+            self.invalidate_membership_cache(project_id=project_id)
+            self.invalidate_rule_cache(project_id)
         return result is not None
 
     async def is_project_member(self, project_id: str, user_id: str) -> bool:
         """Check if user is a member or owner of a project"""
-        def _check_membership():
-            from app.models.project import ProjectMember
+        hit, is_member = self._membership_cache.get((project_id, user_id))
+        if hit:
+            return is_member
 
-            # Check if user is the owner
-            project = Project.query.get(project_id)
-            if not project:
-                return False
-            if project.user_id == user_id:
-                return True
-
-            # Check if user is a member
-            membership = ProjectMember.query.filter_by(
-                project_id=project_id,
-                user_id=user_id
-            ).first()
-            return membership is not None
+        def _check_membership():
+            # Owner OR member check in a single round-trip
+            return db.session.execute(_MEMBERSHIP_CHECK, {'project_id': project_id, 'user_id': user_id}).scalar()
 
         result = await self._safe_execute(_check_membership)
-        return result is not None and result
+        if result is None:
+            return False
+        self._membership_cache.set((project_id, user_id), bool(result))
+        return bool(result)
+
+    def invalidate_membership_cache(self, project_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+        """Drop cached membership checks for a project and/or user"""
+        self._membership_cache.pop_where(
+            lambda key, _: (project_id is None or key[0] == project_id) and (user_id is None or key[1] == user_id))
 
     # Content Operations
     async def create_content(self, project_id: str, content_text: str, content_type: str = 'text',
@@ -439,19 +653,50 @@ class DatabaseService:
 
         return await self._safe_execute(_create_content)
 
-    async def get_project_content(self, project_id: str, limit: int = 100, offset: int = 0) -> List[Content]:
+    async def get_project_content(self, project_id: str, limit: int = 100, offset: int = 0,
+                                  after: Optional[Tuple[datetime, str]] = None) -> List[Content]:
         """Get content for a project with pagination and moderation results"""
         def _get_content():
-            return Content.query.filter_by(project_id=project_id)\
-                .options(joinedload(Content.moderation_results))\
-                .order_by(Content.created_at.desc())\
-                .limit(limit).offset(offset).all()
+            query = Content.query.filter_by(project_id=project_id)\
+                .options(*_strict_loading(selectinload(Content.moderation_results)))
+            # Ordered before OFFSET is applied; the query refuses order_by() after offset()
+            query = query.order_by(Content.created_at.desc(), Content.id.desc())
+            if after:
+                # Keyset pagination: seek past the last (created_at, id) instead of OFFSET
+                query = query.filter(tuple_(Content.created_at, Content.id) < tuple_(*after))
+            else:
+                query = query.offset(offset)
+            return query.limit(limit).all()
 
         return await self._safe_execute(_get_content) or []
 
+    async def get_project_content_previews(self, project_id: str, limit: int = 10,
+                                           preview_length: int = 50) -> List[Dict[str, Any]]:
+        """Get a project's latest content for list views, with a truncated preview instead of the full text
+
+        Use get_content_by_id_and_project for the full row.
+        """
+        def _get_previews():
+            # Column-only select: the full content_data and moderation results are never transferred or hydrated
+            rows = db.session.execute(
+                select(Content.id, Content.content_type, Content.status, Content.created_at,
+                       func.substr(Content.content_data, 1, preview_length).label('content_preview'),
+                       (func.length(Content.content_data) > preview_length).label('is_truncated'))
+                .where(Content.project_id == project_id)
+                .order_by(Content.created_at.desc(), Content.id.desc()).limit(limit)
+            )
+            return [dict(row._mapping) for row in rows]
+
+        return await self._safe_execute(_get_previews) or []
+
     async def get_project_content_with_filters(self, project_id: str, status: str = None, limit: int = 50,
-                                               offset: int = 0) -> List[Content]:
-        """Get content for a project with optional status filter and moderation results"""
+                                               offset: int = 0,
+                                               after: Optional[Tuple[datetime, str]] = None) -> List[Content]:
+        """Get content for a project with optional status filter and moderation results
+
+        Pass ``after`` (the created_at and id of the last item seen) for keyset pagination;
+        ``offset`` is only used when no ``after`` cursor is given.
+        """
         def _get_content():
             # Validate inputs to prevent any potential issues
             validated_limit = limit
@@ -462,30 +707,49 @@ class DatabaseService:
                 validated_offset = 0
 
             query = Content.query.filter_by(project_id=project_id)\
-                .options(joinedload(Content.moderation_results))
+                .options(*_strict_loading(selectinload(Content.moderation_results)))
             if status and isinstance(status, str):
                 # Validate status against known values
                 valid_statuses = {'approved', 'rejected', 'flagged', 'pending'}
                 if status in valid_statuses:
                     query = query.filter_by(status=status)
-            return query.order_by(Content.created_at.desc()).limit(validated_limit).offset(validated_offset).all()
+            # Ordered before OFFSET is applied; the query refuses order_by() after offset()
+            query = query.order_by(Content.created_at.desc(), Content.id.desc())
+            if after:
+                # Keyset pagination: seek past the last (created_at, id) instead of OFFSET
+                query = query.filter(tuple_(Content.created_at, Content.id) < tuple_(*after))
+            else:
+                query = query.offset(validated_offset)
+            return query.limit(validated_limit).all()
 
         return await self._safe_execute(_get_content) or []
 
-    async def get_content_by_id(self, content_id: str) -> Optional[Content]:
-        """Get content by ID with moderation results"""
+    async def get_content_by_id(self, content_id: str) -> Optional[ContentSnapshot]:
+        """Get content by ID as a detached snapshot for the moderation pipeline"""
         def _get_content():
-            return Content.query.options(
-                joinedload(Content.moderation_results)
-            ).filter_by(id=content_id).first()
+            content = db.session.get(Content, content_id)
+            if not content:
+                return None
+            return ContentSnapshot(
+                id=content.id,
+                project_id=content.project_id,
+                content_type=content.content_type,
+                content_data=content.content_data,
+                meta_data=dict(content.meta_data) if content.meta_data else None,
+                status=content.status,
+                api_user_id=content.api_user_id,
+                created_at=content.created_at,
+                updated_at=content.updated_at
+            )
 
         return await self._safe_execute(_get_content)
 
     async def get_content_by_id_and_project(self, content_id: str, project_id: str) -> Optional[Content]:
         """Get content by ID and project ID with moderation results"""
         def _get_content():
+            # selectinload: a joined one-to-many would force .first()'s LIMIT into a subquery
             return Content.query.options(
-                joinedload(Content.moderation_results)
+                *_strict_loading(selectinload(Content.moderation_results))
             ).filter_by(id=content_id, project_id=project_id).first()
 
         return await self._safe_execute(_get_content)
@@ -501,12 +765,36 @@ class DatabaseService:
 
         return await self._safe_execute(_create_key)
 
-    async def get_api_key_by_value(self, key_value: str) -> Optional[APIKey]:
-        """Get API key by value with project relationship loaded"""
-        def _get_key():
-            return APIKey.query.options(joinedload(APIKey.project)).filter_by(key=key_value, is_active=True).first()
+    async def get_api_key_by_value(self, key_value: str) -> Optional[APIKeySnapshot]:
+        """Get active API key by value as a cached snapshot"""
+        hit, snapshot = self._api_key_cache.get(key_value)
+        if hit:
+            return snapshot
+        if self._api_key_miss_cache.get(key_value)[0]:
+            return None
 
-        return await self._safe_execute(_get_key)
+        def _get_key():
+            # Column-only select: no ORM identity map or instance state for a lookup we snapshot anyway
+            row = db.session.execute(_API_KEY_LOOKUP, {'key_value': key_value}).first()
+            if not row:
+                return False  # Not found, as opposed to None for a database error
+            return APIKeySnapshot(**row._mapping)
+
+        snapshot = await self._safe_execute(_get_key)
+        if snapshot is False:
+            self._api_key_miss_cache.set(key_value, None)
+            return None
+        if snapshot:
+            self._api_key_cache.set(key_value, snapshot)
+        return snapshot
+
+    def invalidate_api_key_cache(self, key_value: Optional[str] = None, project_id: Optional[str] = None) -> None:
+        """Drop cached API key lookups for a key value or for all keys of a project"""
+        if key_value:
+            self._api_key_cache.pop(key_value)
+            self._api_key_miss_cache.pop(key_value)
+        if project_id:
+            self._api_key_cache.pop_where(lambda _, snapshot: snapshot.project_id == project_id)
 
     async def get_project_api_keys(self, project_id: str) -> List[APIKey]:
         """Get all API keys for a project"""
@@ -532,6 +820,7 @@ class DatabaseService:
             )
             db.session.add(rule)
             db.session.commit()
+            rule_cache.invalidate(project_id)
             # Return the needed data as a dictionary to avoid detached instance issues
             return {
                 'id': rule.id,
@@ -560,7 +849,7 @@ class DatabaseService:
     async def get_rule_by_id(self, rule_id: str) -> Optional[ModerationRule]:
         """Get moderation rule by ID"""
         def _get_rule():
-            return ModerationRule.query.get(rule_id)
+            return db.session.get(ModerationRule, rule_id)
 
         return await self._safe_execute(_get_rule)
 
@@ -574,36 +863,81 @@ class DatabaseService:
 
         return await self._safe_execute(_get_rules) or []
 
+    async def get_active_rules(self, project_id: str) -> CachedRuleSet:
+        """Get active rules for a project in priority order and split by type, from the rule cache"""
+        cached = rule_cache.get_rules(project_id)
+        if cached is not None:
+            return cached
+
+        def _get_rules():
+            with rule_cache.load_lock(project_id):
+                # Another request may have loaded the rules while we waited
+                cached_now = rule_cache.peek_rules(project_id)
+                if cached_now is not None:
+                    return cached_now
+                version = rule_cache.get_version(project_id)
+                rules = ModerationRule.query.filter_by(project_id=project_id, is_active=True)\
+                    .order_by(ModerationRule.priority.desc()).all()
+                return rule_cache.set_rules(project_id, rules, version)
+
+        return await self._safe_execute(_get_rules) or CachedRuleSet()
+
+    def invalidate_rule_cache(self, project_id: Optional[str] = None) -> None:
+        """Drop cached rules after a rule is created, updated, toggled or deleted"""
+        rule_cache.invalidate(project_id)
+
+    async def set_rule_active(self, project_id: str, rule_id: str, is_active: bool) -> Optional[bool]:
+        """Activate or deactivate a project's rule; False if it does not exist, None on error"""
+        def _set_active():
+            # A single UPDATE scoped to the project instead of loading the rule first
+            updated = db.session.execute(
+                update(ModerationRule)
+                .where(ModerationRule.id == rule_id, ModerationRule.project_id == project_id)
+                .values(is_active=is_active)
+            ).rowcount
+            if not updated:
+                return False
+            db.session.commit()
+            self.invalidate_rule_cache(project_id)
+            return True
+
+        return await self._safe_execute(_set_active)
+
     # Statistics and Analytics
+    @staticmethod
+    def _status_counts(project_id: str) -> Dict[str, int]:
+        """Content counts per status for a project from the maintained counters"""
+        rows = db.session.query(ContentStatusCount.status, ContentStatusCount.count)\
+            .filter(ContentStatusCount.project_id == project_id).all()
+        return {status: count for status, count in rows}
+
     async def get_project_stats(self, project_id: str) -> Dict[str, Any]:
         """Get comprehensive project statistics"""
         def _get_stats():
             from datetime import datetime, timedelta
 
-            total_content = Content.query.filter_by(
-                project_id=project_id).count()
-            total_rules = ModerationRule.query.filter_by(
-                project_id=project_id, is_active=True).count()
-            total_api_keys = APIKey.query.filter_by(
-                project_id=project_id, is_active=True).count()
-            flagged_content = Content.query.filter_by(
-                project_id=project_id, status='flagged').count()
-            approved_content = Content.query.filter_by(
-                project_id=project_id, status='approved').count()
-
             # Recent activity (last 7 days)
             week_ago = datetime.utcnow() - timedelta(days=7)
-            recent_content = Content.query.filter(
-                Content.project_id == project_id,
-                Content.created_at >= week_ago
-            ).count()
+
+            # Status totals come from the maintained counters; only the recency
+            # count touches content, as a range scan on (project_id, created_at).
+            # It rides along with the rule and key counts in a single statement.
+            status_counts = self._status_counts(project_id)
+            recent_content, total_rules, total_api_keys = db.session.query(
+                db.session.query(func.count(Content.id)).filter(
+                    Content.project_id == project_id, Content.created_at >= week_ago).scalar_subquery(),
+                db.session.query(func.count(ModerationRule.id)).filter(
+                    ModerationRule.project_id == project_id, ModerationRule.is_active.is_(True)).scalar_subquery(),
+                db.session.query(func.count(APIKey.id)).filter(
+                    APIKey.project_id == project_id, APIKey.is_active.is_(True)).scalar_subquery()
+            ).one()
 
             return {
-                'total_content': total_content,
+                'total_content': sum(status_counts.values()),
                 'total_rules': total_rules,
                 'total_api_keys': total_api_keys,
-                'flagged_content': flagged_content,
-                'approved_content': approved_content,
+                'flagged_content': status_counts.get('flagged', 0),
+                'approved_content': status_counts.get('approved', 0),
                 'recent_content': recent_content
             }
 
@@ -616,15 +950,33 @@ class DatabaseService:
 
             week_ago = datetime.utcnow() - timedelta(days=7)
 
+            # One aggregate query per table instead of one COUNT per statistic
+            user_counts = db.session.query(
+                func.count(User.id),
+                _count_if(User.is_active.is_(True)),
+                _count_if(User.created_at >= week_ago)
+            ).one()
+            # Status totals come from the maintained counters; the small project and
+            # rule tables ride along as scalar subqueries
+            content_counts = db.session.query(
+                func.coalesce(func.sum(ContentStatusCount.count), 0),
+                func.coalesce(func.sum(ContentStatusCount.count).filter(ContentStatusCount.status == 'flagged'), 0),
+                db.session.query(func.count(Content.id)).filter(
+                    Content.created_at >= week_ago).scalar_subquery(),
+                db.session.query(func.count(Project.id)).scalar_subquery(),
+                db.session.query(func.count(ModerationRule.id)).filter(
+                    ModerationRule.is_active.is_(True)).scalar_subquery()
+            ).one()
+
             return {
-                'total_users': User.query.count(),
-                'active_users': User.query.filter_by(is_active=True).count(),
-                'total_projects': Project.query.count(),
-                'total_content': Content.query.count(),
-                'total_rules': ModerationRule.query.filter_by(is_active=True).count(),
-                'flagged_content': Content.query.filter_by(status='flagged').count(),
-                'new_users_week': User.query.filter(User.created_at >= week_ago).count(),
-                'new_content_week': Content.query.filter(Content.created_at >= week_ago).count(),
+                'total_users': user_counts[0],
+                'active_users': user_counts[1],
+                'total_projects': content_counts[3],
+                'total_content': content_counts[0],
+                'total_rules': content_counts[4],
+                'flagged_content': content_counts[1],
+                'new_users_week': user_counts[2],
+                'new_content_week': content_counts[2],
             }
 
         return await self._safe_execute(_get_stats) or {}
@@ -632,13 +984,24 @@ class DatabaseService:
     async def get_analytics_stats(self) -> Dict[str, Any]:
         """Get comprehensive analytics statistics"""
         def _get_analytics_stats():
+            # One statement: user counts aggregated directly, content and moderation totals
+            # from the maintained counters, the rest as scalar subqueries
+            counts = db.session.query(
+                func.count(User.id),
+                _count_if(User.is_active.is_(True)),
+                db.session.query(func.count(Project.id)).scalar_subquery(),
+                db.session.query(func.coalesce(func.sum(ContentStatusCount.count), 0)).scalar_subquery(),
+                db.session.query(func.coalesce(func.sum(ModerationDecisionCount.count), 0)).scalar_subquery(),
+                db.session.query(func.count(APIKey.id)).filter(APIKey.is_active.is_(True)).scalar_subquery()
+            ).one()
+
             return {
-                'total_users': User.query.count(),
-                'active_users': User.query.filter_by(is_active=True).count(),
-                'total_projects': Project.query.count(),
-                'total_content': Content.query.count(),
-                'total_moderations': ModerationResult.query.count(),
-                'total_api_keys': APIKey.query.filter_by(is_active=True).count(),
+                'total_users': counts[0],
+                'active_users': counts[1],
+                'total_projects': counts[2],
+                'total_content': counts[3],
+                'total_moderations': counts[4],
+                'total_api_keys': counts[5],
             }
 
         return await self._safe_execute(_get_analytics_stats) or {}
@@ -650,29 +1013,50 @@ class DatabaseService:
 
             week_ago = datetime.utcnow() - timedelta(days=7)
 
+            # One aggregate query per table instead of one COUNT per statistic
+            user_counts = db.session.query(
+                func.count(User.id),
+                _count_if(User.is_active.is_(True)),
+                _count_if(User.is_admin.is_(True)),
+                _count_if(User.created_at >= week_ago)
+            ).one()
+            project_counts = db.session.query(
+                func.count(Project.id),
+                _count_if(Project.created_at >= week_ago)
+            ).one()
+            content_counts = db.session.query(
+                func.count(Content.id),
+                _count_if(Content.created_at >= week_ago)
+            ).one()
+            moderation_counts = db.session.query(
+                func.count(ModerationResult.id),
+                _count_if(ModerationResult.decision == 'approved'),
+                _count_if(ModerationResult.decision == 'rejected'),
+                _count_if(ModerationResult.decision == 'flagged'),
+                _count_if(ModerationResult.created_at >= week_ago)
+            ).one()
+
             return {
                 'users': {
-                    'total': User.query.count(),
-                    'active': User.query.filter_by(is_active=True).count(),
-                    'admin': User.query.filter_by(is_admin=True).count(),
-                    'recent': User.query.filter(User.created_at >= week_ago).count()
+                    'total': user_counts[0],
+                    'active': user_counts[1],
+                    'admin': user_counts[2],
+                    'recent': user_counts[3]
                 },
                 'projects': {
-                    'total': Project.query.count(),
-                    'recent': Project.query.filter(Project.created_at >= week_ago).count()
+                    'total': project_counts[0],
+                    'recent': project_counts[1]
                 },
                 'content': {
-                    'total': Content.query.count(),
-                    'recent': Content.query.filter(Content.created_at >= week_ago).count()
+                    'total': content_counts[0],
+                    'recent': content_counts[1]
                 },
                 'moderations': {
-                    'total': ModerationResult.query.count(),
-                    'approved': ModerationResult.query.filter_by(decision='approved').count(),
-                    'rejected': ModerationResult.query.filter_by(decision='rejected').count(),
-                    'flagged': ModerationResult.query.filter_by(decision='flagged').count(),
-                    'recent': ModerationResult.query.filter(
-                        ModerationResult.created_at >= week_ago
-                    ).count()
+                    'total': moderation_counts[0],
+                    'approved': moderation_counts[1],
+                    'rejected': moderation_counts[2],
+                    'flagged': moderation_counts[3],
+                    'recent': moderation_counts[4]
                 }
             }
 
@@ -688,66 +1072,76 @@ class DatabaseService:
                 from datetime import datetime, timedelta
                 validated_end_date = datetime.utcnow()
                 validated_start_date = validated_end_date - timedelta(days=30)
-            # Project overview stats
-            project_stats = {
-                'total_content': Content.query.filter_by(project_id=project_id).count(),
-                'total_moderations': ModerationResult.query.select_from(ModerationResult).join(
-                    Content, ModerationResult.content_id == Content.id
-                ).filter(Content.project_id == project_id).count(),
-                'total_rules': ModerationRule.query.filter_by(project_id=project_id).count(),
-                'total_api_keys': APIKey.query.filter_by(project_id=project_id).count(),
-                'active_api_keys': APIKey.query.filter_by(
-                    project_id=project_id, is_active=True
-                ).count(),
-            }
-
-            # Content submissions over time - using parameterized queries
-            content_submissions = db.session.query(
-                func.date(Content.created_at).label('date'),
+            # Content over the window: one scan grouped by (day, type), pivoted below into
+            # the per-day submissions series and the content type distribution
+            created_date = func.date(Content.created_at)
+            content_rows = db.session.query(
+                created_date.label('date'),
+                Content.content_type,
                 func.count(Content.id).label('count')
             ).filter(
                 Content.project_id == project_id,
                 Content.created_at >= validated_start_date,
                 Content.created_at <= validated_end_date
-            ).group_by(
-                func.date(Content.created_at)
-            ).order_by('date').all()
-
-            # Moderation decisions breakdown - using parameterized queries
-            moderation_decisions = db.session.query(
-                ModerationResult.decision,
-                func.count(ModerationResult.id).label('count')
-            ).select_from(ModerationResult).join(
-                Content, ModerationResult.content_id == Content.id
-            ).filter(
-                Content.project_id == project_id,
+            ).group_by(created_date, Content.content_type).order_by(created_date).all()
+
+            submissions_by_date = {}
+            types_count = {}
+            for row in content_rows:
+                submissions_by_date[row.date] = submissions_by_date.get(row.date, 0) + row.count
+                types_count[row.content_type] = types_count.get(row.content_type, 0) + row.count
+            content_submissions = [{'date': date, 'count': count} for date, count in submissions_by_date.items()]
+            content_types = [{'content_type': content_type, 'count': count}
+                             for content_type, count in types_count.items()]
+
+            # Moderation results: one scan grouped by decision yields the all-time total,
+            # the in-window decision breakdown and the in-window processing time stats
+            in_window = and_(
                 ModerationResult.created_at >= validated_start_date,
                 ModerationResult.created_at <= validated_end_date
-            ).group_by(ModerationResult.decision).all()
-
-            # Content type distribution
-            content_types = db.session.query(
-                Content.content_type,
-                func.count(Content.id).label('count')
-            ).filter(
-                Content.project_id == project_id,
-                Content.created_at >= validated_start_date,
-                Content.created_at <= validated_end_date
-            ).group_by(Content.content_type).all()
-
-            # Processing time stats for this project
-            processing_stats = db.session.query(
-                func.avg(ModerationResult.processing_time).label('avg_time'),
-                func.min(ModerationResult.processing_time).label('min_time'),
-                func.max(ModerationResult.processing_time).label('max_time')
+            )
+            window_time = case((in_window, ModerationResult.processing_time), else_=None)
+            decision_rows = db.session.query(
+                ModerationResult.decision,
+                func.count(ModerationResult.id).label('total'),
+                _count_if(in_window).label('count'),
+                func.sum(window_time).label('time_sum'),
+                func.count(window_time).label('time_count'),
+                func.min(window_time).label('min_time'),
+                func.max(window_time).label('max_time')
             ).select_from(ModerationResult).join(
                 Content, ModerationResult.content_id == Content.id
-            ).filter(
-                Content.project_id == project_id,
-                ModerationResult.created_at >= validated_start_date,
-                ModerationResult.created_at <= validated_end_date,
-                ModerationResult.processing_time.isnot(None)
-            ).first()
+            ).filter(Content.project_id == project_id).group_by(ModerationResult.decision).all()
+
+            moderation_decisions = [{'decision': row.decision, 'count': row.count}
+                                    for row in decision_rows if row.count]
+            timed_rows = [row for row in decision_rows if row.time_count]
+            time_count = sum(row.time_count for row in timed_rows)
+            processing_stats = {
+                'avg_time': sum(row.time_sum for row in timed_rows) / time_count if time_count else None,
+                'min_time': min((row.min_time for row in timed_rows), default=None),
+                'max_time': max((row.max_time for row in timed_rows), default=None)
+            }
+
+            # Project overview stats, fetched as scalar subqueries in a single round trip
+            overview = db.session.query(
+                db.session.query(func.count(Content.id)).filter(
+                    Content.project_id == project_id).scalar_subquery().label('total_content'),
+                db.session.query(func.count(ModerationRule.id)).filter(
+                    ModerationRule.project_id == project_id).scalar_subquery().label('total_rules'),
+                db.session.query(func.count(APIKey.id)).filter(
+                    APIKey.project_id == project_id).scalar_subquery().label('total_api_keys'),
+                db.session.query(func.count(APIKey.id)).filter(
+                    APIKey.project_id == project_id, APIKey.is_active.is_(True)
+                ).scalar_subquery().label('active_api_keys')
+            ).one()
+            project_stats = {
+                'total_content': overview.total_content,
+                'total_moderations': sum(row.total for row in decision_rows),
+                'total_rules': overview.total_rules,
+                'total_api_keys': overview.total_api_keys,
+                'active_api_keys': overview.active_api_keys,
+            }
 
             # API keys and their details for this project
             api_usage = db.session.query(
@@ -760,9 +1154,6 @@ class DatabaseService:
             ).order_by(APIKey.usage_count.desc()).limit(10).all()
 
             # Top users for this project
-            from sqlalchemy import case
-
-            from app.models.api_user import APIUser
             top_users = db.session.query(
                 APIUser.external_user_id,
                 func.count(Content.id).label('submissions'),
@@ -804,9 +1195,8 @@ class DatabaseService:
             ).limit(10).all()
 
             # Recent activity summary
-            from app.models.api_user import APIUser
             recent_content = Content.query.options(
-                joinedload(Content.api_user)
+                *_strict_loading(joinedload(Content.api_user))
             ).filter_by(
                 project_id=project_id
             ).order_by(Content.created_at.desc()).limit(5).all()
@@ -850,24 +1240,44 @@ class DatabaseService:
     async def get_api_user_by_id(self, api_user_id: str) -> Optional[APIUser]:
         """Get API user by ID"""
         def _get_user():
-            return APIUser.query.get(api_user_id)
+            return db.session.get(APIUser, api_user_id)
 
         return await self._safe_execute(_get_user)
 
+    async def record_api_user_decision(self, api_user_id: str, decision: str, *, commit: bool = True) -> bool:
+        """Count a moderation decision on an API user with one UPDATE (pass commit=False inside transaction())"""
+        def _record_decision():
+            values = {'total_requests': APIUser.total_requests + 1, 'last_seen': datetime.utcnow()}
+            counter = _API_USER_DECISION_COUNTERS.get(decision)
+            if counter is not None:
+                values[counter.key] = counter + 1
+            updated = db.session.execute(
+                update(APIUser).where(APIUser.id == api_user_id).values(**values)
+            ).rowcount
+            if commit:
+                db.session.commit()
+            return updated > 0
+
+        return bool(await self._safe_execute(_record_decision))
+
+    async def get_api_users_by_ids(self, api_user_ids: List[str]) -> Dict[str, APIUser]:
+        """Batch-load API users with one IN query, memoized for the current request"""
+        def _get_users():
+            loaded = g.setdefault('_api_users_by_id', {})
+            missing = {api_user_id for api_user_id in api_user_ids if api_user_id and api_user_id not in loaded}
+            if missing:
+                for api_user in APIUser.query.filter(APIUser.id.in_(missing)):
+                    loaded[api_user.id] = api_user
+            return {api_user_id: loaded[api_user_id] for api_user_id in api_user_ids if api_user_id in loaded}
+
+        return await self._safe_execute(_get_users) or {}
+
     # Content Query Operations
     async def get_content_counts_by_status(self, project_id: str) -> Dict[str, int]:
         """Get content counts by moderation status - optimized single query"""
         def _get_counts():
-            # Use GROUP BY to get all counts in a single query
-            status_counts = db.session.query(
-                Content.status,
-                func.count(Content.id).label('count')
-            ).filter(
-                Content.project_id == project_id
-            ).group_by(Content.status).all()
-
-            # Convert to dictionary
-            counts = {status: count for status, count in status_counts}
+            # Read the maintained per-status counters instead of scanning content
+            counts = self._status_counts(project_id)
 
             # Calculate total from the status counts
             total = sum(counts.values())
@@ -885,41 +1295,78 @@ class DatabaseService:
             'total': 0, 'approved': 0, 'rejected': 0, 'flagged': 0, 'pending': 0, 'error': 0
         }
 
-    async def update_content_status(self, content_id: str, **kwargs) -> bool:
-        """Update content status and flags"""
+    async def update_content_status(self, content_id: str, *, commit: bool = True, **kwargs) -> bool:
+        """Update content status and flags (pass commit=False inside transaction())"""
         def _update_content():
-            content = Content.query.get(content_id)
-            if not content:
-                return False
-
-            for key, value in kwargs.items():
-                if hasattr(content, key):
-                    setattr(content, key, value)
+            values = {key: kwargs[key] for key in kwargs.keys() & _CONTENT_UPDATABLE_COLUMNS}
+            if not values:
+                return db.session.query(exists().where(Content.id == content_id)).scalar()
+
+            # A Core UPDATE skips loading the row into the ORM; a status change still needs the
+            # previous status (a light column read) to keep the per-status counters correct
+            previous = None
+            if 'status' in values:
+                previous = db.session.execute(_CONTENT_STATUS_LOOKUP, {'content_id': content_id}).first()
+                if not previous:
+                    return False
 
-            db.session.commit()
-            return True
+            connection = db.session.connection()
+            updated = connection.execute(_CONTENT_UPDATE.values(**values), {'content_id': content_id}).rowcount
+            if updated and previous:
+                record_status_change(connection, previous.project_id, previous.status, values['status'])
+            if commit:
+                db.session.commit()
+            return updated > 0
 
         result = await self._safe_execute(_update_content)
         return result is not None and result is not False
 
     # API Key Management
-    async def update_api_key_usage(self, api_key: APIKey) -> bool:
-        """Update API key usage statistics"""
-        def _update_usage():
-            # Get fresh instance from database using the key ID
-            fresh_api_key = APIKey.query.filter_by(id=api_key.id).first()
-            if fresh_api_key:
-                fresh_api_key.increment_usage()
-                db.session.commit()
-                return True
-            return False
+    async def set_api_key_active(self, project_id: str, key_id: str, is_active: bool) -> Optional[bool]:
+        """Activate or deactivate a project's API key; False if it does not exist, None on error"""
+        def _set_active():
+            # A single UPDATE ... RETURNING the key value, which the lookup cache is keyed by
+            key_value = db.session.execute(
+                update(APIKey)
+                .where(APIKey.id == key_id, APIKey.project_id == project_id)
+                .values(is_active=is_active)
+                .returning(APIKey.key)
+            ).scalar()
+            if key_value is None:
+                return False
+            db.session.commit()
+            self.invalidate_api_key_cache(key_value=key_value)
+            return True
 
-        result = await self._safe_execute(_update_usage)
-        return result is not None
+        return await self._safe_execute(_set_active)
+
+    async def update_api_key_usage(self, api_key: APIKey) -> bool:
+        """Record API key usage; written to the database in periodic batches"""
+        self._usage_buffer.record(api_key.id, current_app._get_current_object())
+        return True
 
     # Transaction Management
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group several writes under a single commit
+
+        Writes inside the block should be called with commit=False. The session is
+        committed once when the block exits, or rolled back if it raises. Service
+        operations called inside the block raise on failure instead of returning None,
+        so a failed write can never be followed by a commit of the remaining ones.
+        """
+        g._db_transaction_depth = g.get('_db_transaction_depth', 0) + 1
+        try:
+            yield
+            db.session.commit()
+        except Exception:
+            self._rollback_session()
+            raise
+        finally:
+            g._db_transaction_depth -= 1
+
     async def commit_transaction(self) -> bool:
-        """Commit current transaction"""
+        """Commit current transaction (deprecated: prefer ``async with transaction()``)"""
         def _commit():
             db.session.commit()
             return True
@@ -935,146 +1382,278 @@ class DatabaseService:
         await self._safe_execute(_rollback)
 
     # Admin-specific methods
-    async def get_recent_users(self, limit: int = 5) -> List[User]:
-        """Get recent users for admin dashboard"""
+    async def _cached_dashboard_query(self, key, operation_func):
+        """Serve an admin dashboard query from the short-TTL cache, running it on a miss
+
+        Cached values are plain dicts/lists, never ORM instances, so they are safe to
+        share between requests and sessions.
+        """
+        hit, value = self._dashboard_cache.get(key)
+        if hit:
+            return value
+        value = await self._safe_execute(operation_func)
+        if value is not None:
+            self._dashboard_cache.set(key, value)
+        return value
+
+    async def get_admin_dashboard(self, users_limit: int = 5, projects_limit: int = 5,
+                                  content_limit: int = 10) -> Dict[str, Any]:
+        """Load every admin dashboard widget concurrently
+
+        Each query runs on the shared executor under its own app context (and so its own
+        session and pooled connection), so the page waits for the slowest query instead of
+        the sum of all of them. All results are plain dicts and lists.
+        """
+        app = current_app._get_current_object()
+
+        def _run(coroutine_func, *args):
+            with app.app_context():
+                return asyncio.run(coroutine_func(*args))
+
+        widgets = {
+            'stats': (self.get_admin_stats,),
+            'recent_users': (self.get_recent_users, users_limit),
+            'recent_projects': (self.get_recent_projects, projects_limit),
+            'recent_content': (self.get_recent_content_admin, content_limit),
+            'moderation_stats': (self.get_moderation_result_stats,),
+        }
+        results = await asyncio.gather(
+            *(asyncio.wrap_future(self._executor.submit(_run, *call)) for call in widgets.values()))
+        return dict(zip(widgets, results))
+
+    async def get_recent_users(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get recent users for admin dashboard (briefly cached snapshots)"""
         def _get_recent():
-            return User.query.order_by(User.created_at.desc()).limit(limit).all()
+            rows = db.session.execute(
+                select(User.id, User.username, User.email, User.is_admin, User.is_active, User.created_at)
+                .order_by(User.created_at.desc()).limit(limit)
+            )
+            return [dict(row._mapping) for row in rows]
 
-        return await self._safe_execute(_get_recent) or []
+        return await self._cached_dashboard_query(('recent_users', limit), _get_recent) or []
 
-    async def get_recent_projects(self, limit: int = 5) -> List[Project]:
-        """Get recent projects for admin dashboard"""
+    async def get_recent_projects(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get recent projects for admin dashboard (briefly cached snapshots)"""
         def _get_recent():
-            return Project.query.options(
-                joinedload(Project.owner)
-            ).order_by(Project.created_at.desc()).limit(limit).all()
+            rows = db.session.execute(
+                select(Project.id, Project.name, Project.created_at, User.username)
+                .join(User, User.id == Project.user_id)
+                .order_by(Project.created_at.desc()).limit(limit)
+            )
+            return [{
+                'id': row.id,
+                'name': row.name,
+                'created_at': row.created_at,
+                'owner': {'username': row.username}
+            } for row in rows]
 
-        return await self._safe_execute(_get_recent) or []
+        return await self._cached_dashboard_query(('recent_projects', limit), _get_recent) or []
 
-    async def get_recent_content_admin(self, limit: int = 10) -> List[Content]:
-        """Get recent content for admin dashboard"""
+    async def get_recent_content_admin(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get recent content for admin dashboard (briefly cached snapshots)"""
         def _get_recent():
-            return Content.query.options(
-                joinedload(Content.project).joinedload(Project.owner)
-            ).order_by(Content.created_at.desc()).limit(limit).all()
+            rows = db.session.execute(
+                select(Content.id, func.substr(Content.content_data, 1, 200).label('content_preview'),
+                       Content.created_at, Project.name.label('project_name'), User.username)
+                .join(Project, Project.id == Content.project_id)
+                .join(User, User.id == Project.user_id)
+                .order_by(Content.created_at.desc()).limit(limit)
+            )
+            return [{
+                'id': row.id,
+                'content_preview': row.content_preview,
+                'created_at': row.created_at,
+                'project': {
+                    'name': row.project_name,
+                    'owner': {'username': row.username}
+                }
+            } for row in rows]
 
-        return await self._safe_execute(_get_recent) or []
+        return await self._cached_dashboard_query(('recent_content', limit), _get_recent) or []
 
     async def get_moderation_result_stats(self) -> Dict[str, Any]:
-        """Get moderation result statistics"""
+        """Get moderation result statistics (briefly cached)"""
         def _get_stats():
+            # Read the maintained per-decision counters instead of scanning moderation_results
+            counts = dict(db.session.query(
+                ModerationDecisionCount.decision,
+                ModerationDecisionCount.count
+            ).all())
+
             return {
-                'total_moderations': ModerationResult.query.count(),
-                'approved_decisions': ModerationResult.query.filter_by(decision='approved').count(),
-                'rejected_decisions': ModerationResult.query.filter_by(decision='rejected').count(),
-                'flagged_decisions': ModerationResult.query.filter_by(decision='flagged').count(),
+                'total_moderations': sum(counts.values()),
+                'approved_decisions': counts.get('approved', 0),
+                'rejected_decisions': counts.get('rejected', 0),
+                'flagged_decisions': counts.get('flagged', 0),
             }
 
-        return await self._safe_execute(_get_stats) or {}
+        return await self._cached_dashboard_query(('moderation_result_stats',), _get_stats) or {}
 
     async def get_user_projects_for_admin(self, user_id: str) -> List[Dict]:
         """Get user projects for admin view with counts instead of loading all related data"""
         def _get_projects():
-            # Get projects with counts using subqueries to avoid N+1 problem
-            content_count = db.session.query(func.count(Content.id)).filter(
-                Content.project_id == Project.id
-            ).scalar_subquery()
-
-            rules_count = db.session.query(func.count(ModerationRule.id)).filter(
-                ModerationRule.project_id == Project.id
-            ).scalar_subquery()
-
-            api_keys_count = db.session.query(func.count(APIKey.id)).filter(
-                APIKey.project_id == Project.id
-            ).scalar_subquery()
-
-            projects = db.session.query(
-                Project,
-                content_count.label('content_count'),
-                rules_count.label('rules_count'),
-                api_keys_count.label('api_keys_count')
-            ).filter_by(user_id=user_id).all()
+            # Per-project counts as grouped derived tables, aggregated once and LEFT JOINed,
+            # instead of three correlated subqueries evaluated per project row. Each is
+            # restricted to this user's projects so it never aggregates the whole table.
+            user_project_ids = select(Project.id).where(Project.user_id == user_id)
+            content_counts = select(
+                ContentStatusCount.project_id, func.sum(ContentStatusCount.count).label('n')
+            ).where(ContentStatusCount.project_id.in_(user_project_ids)).group_by(
+                ContentStatusCount.project_id).subquery()
+            rules_counts = select(
+                ModerationRule.project_id, func.count(ModerationRule.id).label('n')
+            ).where(ModerationRule.project_id.in_(user_project_ids)).group_by(
+                ModerationRule.project_id).subquery()
+            keys_counts = select(
+                APIKey.project_id, func.count(APIKey.id).label('n')
+            ).where(APIKey.project_id.in_(user_project_ids)).group_by(APIKey.project_id).subquery()
+
+            # Only the columns the admin view shows, as plain rows: no Project instances to hydrate
+            rows = db.session.execute(
+                select(
+                    Project.id, Project.name, Project.description, Project.created_at,
+                    func.coalesce(content_counts.c.n, 0).label('content_count'),
+                    func.coalesce(rules_counts.c.n, 0).label('rules_count'),
+                    func.coalesce(keys_counts.c.n, 0).label('api_keys_count')
+                ).outerjoin(content_counts, content_counts.c.project_id == Project.id)
+                .outerjoin(rules_counts, rules_counts.c.project_id == Project.id)
+                .outerjoin(keys_counts, keys_counts.c.project_id == Project.id)
+                .where(Project.user_id == user_id)
+            ).all()
 
             # Convert to dict format for template
-            result = []
-            for project, content_count, rules_count, api_keys_count in projects:
-                result.append({
-                    'project': project,
-                    'content_count': content_count or 0,
-                    'rules_count': rules_count or 0,
-                    'api_keys_count': api_keys_count or 0
-                })
-
-            return result
+            return [{
+                'project': {
+                    'id': row.id,
+                    'name': row.name,
+                    'description': row.description,
+                    'created_at': row.created_at
+                },
+                'content_count': row.content_count or 0,
+                'rules_count': row.rules_count or 0,
+                'api_keys_count': row.api_keys_count or 0
+            } for row in rows]
 
         return await self._safe_execute(_get_projects) or []
 
-    async def get_all_projects_for_admin(self, page: int = 1, per_page: int = 20) -> List[Project]:
-        """Get all projects for admin view with pagination (lightweight)"""
+    async def get_all_projects_for_admin(self, page: int = 1, per_page: int = 20,
+                                         after: Optional[Tuple[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """Get all projects for admin view with pagination, as plain dicts (lightweight)
+
+        Pass ``after`` (the created_at and id of the last project seen) for keyset
+        pagination; ``page`` is only used when no ``after`` cursor is given.
+        """
         def _get_projects():
-            offset = (page - 1) * per_page
-            # Only load owner data, not all content/rules/keys which can be huge
-            return Project.query.options(
-                joinedload(Project.owner)
-            ).offset(offset).limit(per_page).all()
+            # Only the columns the listing shows, plus the owner's; no ORM instances are built
+            query = db.session.query(
+                Project.id, Project.name, Project.description, Project.user_id, Project.created_at,
+                User.username, User.is_admin
+            ).join(User, User.id == Project.user_id).order_by(Project.created_at.desc(), Project.id.desc())
+            if after:
+                query = query.filter(tuple_(Project.created_at, Project.id) < tuple_(*after))
+            else:
+                query = query.offset((page - 1) * per_page)
+            rows = query.limit(per_page)
+            return [{
+                'id': row.id,
+                'name': row.name,
+                'description': row.description,
+                'user_id': row.user_id,
+                'created_at': row.created_at,
+                'owner': {'username': row.username, 'is_admin': row.is_admin}
+            } for row in rows]
 
         return await self._safe_execute(_get_projects) or []
 
-    async def get_project_bulk_stats(self, project_ids: list) -> dict:
-        """Get bulk statistics for multiple projects"""
+    async def get_project_bulk_stats(self, project_ids: list, active_only: bool = False) -> dict:
+        """Get bulk statistics for multiple projects (only active rules and keys if active_only)"""
         def _get_stats():
-            # Get counts for all projects in bulk
-            content_counts = dict(db.session.query(
-                Content.project_id, func.count(Content.id)
-            ).filter(Content.project_id.in_(project_ids)).group_by(Content.project_id).all())
-
-            rules_counts = dict(db.session.query(
-                ModerationRule.project_id, func.count(ModerationRule.id)
-            ).filter(ModerationRule.project_id.in_(project_ids)).group_by(ModerationRule.project_id).all())
-
-            keys_counts = dict(db.session.query(
-                APIKey.project_id, func.count(APIKey.id)
-            ).filter(APIKey.project_id.in_(project_ids)).group_by(APIKey.project_id).all())
+            # All three per-project counts in one UNION ALL round trip, tagged by source;
+            # content totals come from the maintained status counters
+            content_branch = select(
+                literal('content').label('source'), ContentStatusCount.project_id, func.sum(ContentStatusCount.count)
+            ).where(ContentStatusCount.project_id.in_(project_ids)).group_by(ContentStatusCount.project_id)
+            rules_branch = select(
+                literal('rules').label('source'), ModerationRule.project_id, func.count(ModerationRule.id)
+            ).where(ModerationRule.project_id.in_(project_ids)).group_by(ModerationRule.project_id)
+            keys_branch = select(
+                literal('keys').label('source'), APIKey.project_id, func.count(APIKey.id)
+            ).where(APIKey.project_id.in_(project_ids)).group_by(APIKey.project_id)
+            if active_only:
+                rules_branch = rules_branch.where(ModerationRule.is_active.is_(True))
+                keys_branch = keys_branch.where(APIKey.is_active.is_(True))
+
+            counts = {'content': {}, 'rules': {}, 'keys': {}}
+            for source, project_id, count in db.session.execute(
+                    union_all(content_branch, rules_branch, keys_branch)):
+                counts[source][project_id] = count
 
             return {
-                'content_counts': content_counts,
-                'rules_counts': rules_counts,
-                'keys_counts': keys_counts
+                'content_counts': counts['content'],
+                'rules_counts': counts['rules'],
+                'keys_counts': counts['keys']
             }
 
         return await self._safe_execute(_get_stats)
 
-    async def get_flagged_content_for_projects(self, project_ids: list, page: int = 1, per_page: int = 50) -> tuple:
-        """Get flagged content for multiple projects with pagination"""
+    async def get_flagged_content_for_projects(self, project_ids: list, page: int = 1, per_page: int = 50,
+                                               after: Optional[Tuple[datetime, str]] = None) -> tuple:
+        """Get flagged content for multiple projects with pagination, as (items, has_more)
+
+        Pass ``after`` (the created_at and id of the last item seen) for keyset
+        pagination; ``page`` is only used when no ``after`` cursor is given.
+        """
         def _get_flagged_content():
             if not project_ids:
-                return [], 0
+                return [], False
 
             query = Content.query.filter(
                 Content.project_id.in_(project_ids),
                 Content.status == 'flagged'
             ).options(
-                joinedload(Content.moderation_results),
-                joinedload(Content.project)
-            ).order_by(Content.created_at.desc())
-
-            # Get total count
-            total = query.count()
+                # The review queue only shows the project name; moderation results are
+                # loaded on the per-item review page
+                *_strict_loading(joinedload(Content.project))
+            ).order_by(Content.created_at.desc(), Content.id.desc())
 
-            # Apply pagination
-            offset = (page - 1) * per_page
-            items = query.offset(offset).limit(per_page).all()
+            # Apply pagination (after ordering: order_by() is refused once offset() is applied)
+            if after:
+                query = query.filter(tuple_(Content.created_at, Content.id) < tuple_(*after))
+            else:
+                query = query.offset((page - 1) * per_page)
 
-            return items, total
+            # Fetch one extra row to learn whether another page exists, instead of a COUNT
+            rows = query.limit(per_page + 1).all()
+            return rows[:per_page], len(rows) > per_page
 
         return await self._safe_execute(_get_flagged_content)
 
-    async def bulk_save_objects(self, objects: List) -> bool:
-        """Bulk save objects to database"""
+    async def bulk_save_objects(self, objects: List, chunk_size: int = 1000, commit: bool = True) -> bool:
+        """Bulk insert new objects, one batched INSERT per chunk, and commit once (unless commit=False)
+
+        Objects are written without unit-of-work bookkeeping or mapper events and are not
+        attached to the session afterwards, so only use this for insert-only rows.
+        """
         def _bulk_save():
+            # Plain column dicts per model through an ORM bulk insert(): the driver gets one
+            # executemany (insertmanyvalues) per chunk and no per-object state is tracked
+            rows_by_model: Dict[type, List[Dict[str, Any]]] = {}
             for obj in objects:
-                db.session.add(obj)
-            db.session.commit()
+                state = inspect(obj)
+                rows_by_model.setdefault(type(obj), []).append({
+                    attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict
+                })
+            for model, rows in rows_by_model.items():
+                for start in range(0, len(rows), chunk_size):
+                    db.session.execute(insert(model), rows[start:start + chunk_size])
+            # Mapper events don't fire for bulk inserts, so keep the decision counters in step here
+            decisions: Dict[str, int] = {}
+            for obj in objects:
+                if isinstance(obj, ModerationResult):
+                    decisions[obj.decision] = decisions.get(obj.decision, 0) + 1
+            record_decisions(db.session.connection(), decisions)
+            if commit:
+                db.session.commit()
             return True
 
         result = await self._safe_execute(_bulk_save)
@@ -1121,12 +1700,17 @@ class DatabaseService:
                 # Delete in correct order to avoid foreign key violations:
                 # 1. Delete moderation results first
                 if content_ids:
-                    ModerationResult.query.filter(
-                        ModerationResult.content_id.in_(content_ids)).delete(
-                        synchronize_session=False)
-
-                # 2. Delete content
+                    results = ModerationResult.query.filter(ModerationResult.content_id.in_(content_ids))
+                    removed = dict(results.with_entities(
+                        ModerationResult.decision, func.count(ModerationResult.id)
+                    ).group_by(ModerationResult.decision).all())
+                    results.delete(synchronize_session=False)
+                    record_decisions(db.session.connection(),
+                                     {decision: -count for decision, count in removed.items()})
+
+                # 2. Delete content (bulk delete skips mapper events, so recount this project)
                 Content.query.filter_by(api_user_id=api_user.id).delete(synchronize_session=False)
+                ContentStatusCount.rebuild(db.session.connection(), project_id)
 
                 # 3. Delete the APIUser record
                 db.session.delete(api_user)
@@ -1135,9 +1719,9 @@ class DatabaseService:
                 db.session.commit()
 
                 logger.info(
-                    f"Deleted user data for external_user_id={external_user_id} "
-                    f"in project_id={project_id}: "
-                    f"{content_count} content items, {moderation_results_count} moderation results"
+                    "Deleted user data for external_user_id=%s in project_id=%s: "
+                    "%d content items, %d moderation results",
+                    external_user_id, project_id, content_count, moderation_results_count
                 )
 
                 return {
@@ -1153,7 +1737,7 @@ class DatabaseService:
 
             except SQLAlchemyError as e:
                 db.session.rollback()
-                logger.error(f"Error deleting user data for {external_user_id}: {str(e)}")
+                logger.error("Error deleting user data for %s: %s", external_user_id, e)
                 return {
                     'success': False,
                     'error': str(e),
@@ -1215,7 +1799,7 @@ class DatabaseService:
                 }
 
             except SQLAlchemyError as e:
-                logger.error(f"Error searching user by external_id {external_user_id}: {str(e)}")
+                logger.error("Error searching user by external_id %s: %s", external_user_id, e)
                 return None
 
         return await self._safe_execute(_search_user)
@@ -1,25 +1,36 @@
 """
 In-memory error tracking for system health monitoring
 """
+import itertools
 import time
-from collections import deque
+from collections import Counter, deque
 from threading import Lock
 from typing import Dict, List
 
+_ERROR_TYPES = ('database', 'processing', 'api', 'moderation', 'other')
+
+
+def _format_time_ago(seconds_ago: int) -> str:
+    if seconds_ago < 60:
+        return f"{seconds_ago}s ago"
+    if seconds_ago < 3600:
+        return f"{seconds_ago // 60}m ago"
+    return f"{seconds_ago // 3600}h ago"
+
 
 class ErrorTracker:
-    """Track recent errors for monitoring and debugging"""
+    """Track recent errors for monitoring and debugging
+
+    Recording an error takes no lock: the deque append is atomic and the
+    per-type counter is a plain int increment, so worker threads never wait on
+    one another during an error storm. Counts and stats are approximate: a
+    rare concurrent increment of the same type may be lost.
+    """
 
     # Shared error tracking across all instances
     _recent_errors = deque(maxlen=100)  # Keep last 100 errors
-    _error_counts = {
-        'database': 0,
-        'processing': 0,
-        'api': 0,
-        'moderation': 0,
-        'other': 0
-    }
-    _lock = Lock()
+    _error_counts = Counter(dict.fromkeys(_ERROR_TYPES, 0))
+    _lock = Lock()  # Only serializes clear_old_errors
 
     @classmethod
     def track_error(cls, error_type: str, message: str, content_id: str = None, details: Dict = None):
@@ -32,62 +43,51 @@ class ErrorTracker:
             content_id: Optional content ID associated with error
             details: Optional additional details
         """
-        with cls._lock:
-            error_entry = {
-                'timestamp': time.time(),
-                'type': error_type,
-                'message': message,
-                'content_id': content_id,
-                'details': details or {}
-            }
-            cls._recent_errors.append(error_entry)
-
-            # Increment error type counter
-            if error_type in cls._error_counts:
-                cls._error_counts[error_type] += 1
-            else:
-                cls._error_counts['other'] += 1
+        cls._recent_errors.append({
+            'timestamp': time.time(),
+            'type': error_type,
+            'message': message,
+            'content_id': content_id,
+            'details': details or {}
+        })
+
+        # Increment error type counter
+        cls._error_counts[error_type if error_type in cls._error_counts else 'other'] += 1
 
     @classmethod
     def get_recent_errors(cls, limit: int = 50) -> List[Dict]:
         """Get recent errors with optional limit"""
-        with cls._lock:
-            # Convert deque to list and get last N items
-            errors = list(cls._recent_errors)[-limit:]
-            # Add human-readable timestamps
-            for error in errors:
-                seconds_ago = int(time.time() - error['timestamp'])
-                if seconds_ago < 60:
-                    error['time_ago'] = f"{seconds_ago}s ago"
-                elif seconds_ago < 3600:
-                    error['time_ago'] = f"{seconds_ago // 60}m ago"
-                else:
-                    error['time_ago'] = f"{seconds_ago // 3600}h ago"
-            return errors
+        # Take only the newest N entries (one C-level step, so concurrent appends can't interrupt it)
+        newest = list(itertools.islice(reversed(cls._recent_errors), max(limit, 0)))
+        now = time.time()
+        # Build new dicts so the stored entries are never modified
+        return [
+            {**error, 'time_ago': _format_time_ago(int(now - error['timestamp']))}
+            for error in reversed(newest)
+        ]
 
     @classmethod
     def get_error_counts(cls) -> Dict[str, int]:
         """Get error counts by type"""
-        with cls._lock:
-            return cls._error_counts.copy()
+        return dict(cls._error_counts)
 
     @classmethod
     def get_error_stats(cls) -> Dict:
         """Get comprehensive error statistics"""
-        with cls._lock:
-            total_errors = sum(cls._error_counts.values())
-            recent_count = len(cls._recent_errors)
-
-            # Count errors in last 5 minutes
-            five_min_ago = time.time() - 300
-            recent_5min = sum(1 for e in cls._recent_errors if e['timestamp'] > five_min_ago)
-
-            return {
-                'total_errors': total_errors,
-                'recent_errors': recent_count,
-                'errors_last_5min': recent_5min,
-                'error_counts': cls._error_counts.copy()
-            }
+        # list() copies the deque in one step, so concurrent appends can't break the iteration below
+        recent_errors = list(cls._recent_errors)
+        error_counts = cls.get_error_counts()
+
+        # Count errors in last 5 minutes
+        five_min_ago = time.time() - 300
+        recent_5min = sum(1 for e in recent_errors if e['timestamp'] > five_min_ago)
+
+        return {
+            'total_errors': sum(error_counts.values()),
+            'recent_errors': len(recent_errors),
+            'errors_last_5min': recent_5min,
+            'error_counts': error_counts
+        }
 
     @classmethod
     def clear_old_errors(cls, max_age_seconds: int = 3600):
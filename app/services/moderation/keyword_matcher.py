@@ -0,0 +1,132 @@
+import re
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; falls back to a regex alternation
+    ahocorasick = None
+
+
+def parse_keywords(keywords):
+    """Normalize a keyword rule's keywords (list, or newline-separated string) to a list"""
+    if isinstance(keywords, str):
+        return [line.strip() for line in keywords.split('\n') if line.strip()]
+    return list(keywords or [])
+
+
+class KeywordMatcher:
+    """Precompiled multi-keyword matcher for a keyword rule
+
+    Built once when the rule is cached; a single pass over the content then checks
+    every keyword at once instead of one substring search per keyword. Uses an
+    Aho-Corasick automaton when pyahocorasick is installed, otherwise one regex
+    alternation of the escaped keywords (a single scan in the C regex engine).
+    """
+
+    __slots__ = ('case_sensitive', '_automaton', '_pattern', '_keywords')
+
+    def __init__(self, keywords, case_sensitive=False):
+        self.case_sensitive = case_sensitive
+        # Needle as matched -> keyword as written, for the match reason
+        needles = {}
+        for keyword in keywords:
+            needle = keyword if case_sensitive else keyword.lower()
+            if needle:
+                needles.setdefault(needle, keyword)
+
+        self._automaton = None
+        self._pattern = None
+        self._keywords = needles
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for needle, keyword in needles.items():
+                self._automaton.add_word(needle, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile('|'.join(re.escape(needle) for needle in needles))
+
+    @classmethod
+    def from_rule_data(cls, rule_data):
+        """Matcher for a keyword rule, or None if it has no keywords"""
+        keywords = parse_keywords(rule_data.get('keywords'))
+        if not any(keywords):
+            return None
+        return cls(keywords, rule_data.get('case_sensitive', False))
+
+    def search(self, content, content_lower=None):
+        """Return the first keyword found in the content, or None
+
+        Pass ``content_lower`` when the caller already lowercased the content.
+        """
+        if self.case_sensitive:
+            text = content
+        else:
+            text = content_lower if content_lower is not None else content.lower()
+
+        if self._automaton is not None:
+            for _, keyword in self._automaton.iter(text):
+                return keyword
+            return None
+
+        match = self._pattern.search(text)
+        return self._keywords[match.group(0)] if match else None
+
+
+class ProjectKeywordMatcher:
+    """One Aho-Corasick automaton over every keyword rule of a project
+
+    A single pass over the content finds which keyword rules match, instead of one
+    scan per rule. Overlapping keywords from different rules are all reported, so
+    the caller can still pick the highest-priority rule. Only built when
+    pyahocorasick is installed; without it each rule's own matcher is used.
+    """
+
+    __slots__ = ('_sensitive', '_insensitive')
+
+    def __init__(self, rules):
+        self._sensitive = None
+        self._insensitive = None
+        for rule in rules:
+            case_sensitive = rule.rule_data.get('case_sensitive', False)
+            for keyword in parse_keywords(rule.rule_data.get('keywords')):
+                needle = keyword if case_sensitive else keyword.lower()
+                if not needle:
+                    continue
+                automaton = self._automaton(case_sensitive)
+                hits = automaton.get(needle, None)
+                if hits is None:
+                    hits = []
+                    automaton.add_word(needle, hits)
+                hits.append((rule.id, keyword))
+        for automaton in (self._sensitive, self._insensitive):
+            if automaton is not None:
+                automaton.make_automaton()
+
+    def _automaton(self, case_sensitive):
+        if case_sensitive:
+            if self._sensitive is None:
+                self._sensitive = ahocorasick.Automaton()
+            return self._sensitive
+        if self._insensitive is None:
+            self._insensitive = ahocorasick.Automaton()
+        return self._insensitive
+
+    @classmethod
+    def from_rules(cls, keyword_rules):
+        """Matcher for a project's keyword rules, or None if it would not save any scans"""
+        if ahocorasick is None or len(keyword_rules) < 2:
+            return None
+        return cls(keyword_rules)
+
+    def search(self, content, content_lower=None):
+        """Return {rule_id: first keyword found} for every keyword rule that matches"""
+        matches = {}
+        if self._sensitive is not None:
+            for _, hits in self._sensitive.iter(content):
+                for rule_id, keyword in hits:
+                    matches.setdefault(rule_id, keyword)
+        if self._insensitive is not None:
+            text = content_lower if content_lower is not None else content.lower()
+            for _, hits in self._insensitive.iter(text):
+                for rule_id, keyword in hits:
+                    matches.setdefault(rule_id, keyword)
+        return matches
@@ -0,0 +1,63 @@
+import re
+
+REGEX_FLAGS = {'i': re.IGNORECASE, 'm': re.MULTILINE, 's': re.DOTALL}
+
+# Numbered backreferences and group conditionals change meaning once patterns are combined
+_NUMBERED_GROUP_REF = re.compile(r'\\[1-9]|\(\?\(\d')
+
+
+def regex_flags(flags_list):
+    """Combine a regex rule's flag letters ('i', 'm', 's') into re flags"""
+    flags = 0
+    if isinstance(flags_list, list):
+        for flag in flags_list:
+            flags |= REGEX_FLAGS.get(flag, 0)
+    return flags
+
+
+class RegexPrefilter:
+    """Combined alternation of a project's regex rules, used to skip them all at once
+
+    Most content matches no rule, so one scan per flag set that proves none of the
+    patterns can match replaces one scan per rule. When it does find a match, the
+    rules are still evaluated one by one in priority order, because the leftmost
+    alternative is not necessarily the highest-priority rule.
+    """
+
+    __slots__ = ('_patterns',)
+
+    def __init__(self, patterns):
+        self._patterns = patterns
+
+    @classmethod
+    def from_rules(cls, regex_rules):
+        """Prefilter for a project's regex rules, or None if they cannot be safely combined"""
+        if len(regex_rules) < 2:
+            return None
+
+        by_flags = {}
+        for rule in regex_rules:
+            pattern = rule.rule_data.get('pattern', '')
+            if not pattern:
+                continue  # Never matches
+            flags = regex_flags(rule.rule_data.get('flags', []))
+            try:
+                re.compile(pattern, flags)
+            except re.error:
+                continue  # Never matches; the rule reports it as invalid
+            if _NUMBERED_GROUP_REF.search(pattern):
+                return None
+            by_flags.setdefault(flags, []).append(pattern)
+
+        try:
+            return cls(tuple(
+                re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+                for flags, patterns in by_flags.items()
+            ))
+        except re.error:
+            # e.g. duplicate group names, or inline global flags that must lead the pattern
+            return None
+
+    def may_match(self, content):
+        """False only if no regex rule can match the content"""
+        return any(pattern.search(content) for pattern in self._patterns)
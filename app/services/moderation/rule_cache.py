@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from .keyword_matcher import KeywordMatcher, ProjectKeywordMatcher
+from .regex_prefilter import RegexPrefilter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRule:
+    """Detached, read-only copy of an active ModerationRule used on the moderation hot path"""
+    id: str
+    project_id: str
+    name: str
+    rule_type: str
+    rule_data: Dict[str, Any]
+    action: str
+    priority: int
+    # Precompiled keyword matcher, built once per cache load (keyword rules only)
+    matcher: Optional[KeywordMatcher] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_model(cls, rule) -> 'CachedRule':
+        rule_data = rule.rule_data or {}
+        return cls(
+            id=rule.id,
+            project_id=rule.project_id,
+            name=rule.name,
+            rule_type=rule.rule_type,
+            rule_data=rule_data,
+            action=rule.action,
+            priority=rule.priority or 0,
+            matcher=KeywordMatcher.from_rule_data(rule_data) if rule.rule_type == 'keyword' else None
+        )
+
+
+@dataclass(frozen=True)
+class CachedRuleSet:
+    """A project's active rules in priority order, pre-partitioned for the moderation hot path"""
+    rules: Tuple[CachedRule, ...] = ()
+    fast_rules: Tuple[CachedRule, ...] = ()  # keyword and regex rules
+    ai_rules: Tuple[CachedRule, ...] = ()
+    has_keyword_rules: bool = False
+    # Single-pass matcher over all keyword rules (None when not worth building)
+    keyword_matcher: Optional[ProjectKeywordMatcher] = field(default=None, compare=False, repr=False)
+    # One combined scan that rules out every regex rule at once (None when not safe to combine)
+    regex_prefilter: Optional[RegexPrefilter] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_rules(cls, rules) -> 'CachedRuleSet':
+        # Stable sort, so rules with equal priority keep the order they were loaded in
+        ordered = tuple(sorted(rules, key=lambda rule: rule.priority, reverse=True))
+        fast_rules = tuple(rule for rule in ordered if rule.rule_type in ('keyword', 'regex'))
+        keyword_rules = [rule for rule in fast_rules if rule.rule_type == 'keyword']
+        return cls(
+            rules=ordered,
+            fast_rules=fast_rules,
+            ai_rules=tuple(rule for rule in ordered if rule.rule_type == 'ai_prompt'),
+            has_keyword_rules=bool(keyword_rules),
+            keyword_matcher=ProjectKeywordMatcher.from_rules(keyword_rules),
+            regex_prefilter=RegexPrefilter.from_rules(
+                [rule for rule in fast_rules if rule.rule_type == 'regex'])
+        )
+
+
+class RuleCache:
+    """Per-project cache of active moderation rules, shared across instances
+
+    Entries expire after the TTL and are dropped explicitly whenever a rule is
+    created, updated, toggled or deleted. The cache is bounded: when full, the
+    oldest entry is evicted. Each project carries a version counter so a load
+    that raced with an invalidation is never stored, and misses for the same
+    project are serialized on a striped load lock so concurrent requests after
+    an expiry trigger a single database load instead of one each.
+    """
+
+    # project_id -> (rules, monotonic expiry time), in insertion order for eviction
+    _entries: Dict[str, Tuple[CachedRuleSet, float]] = {}
+    _versions: Dict[str, int] = {}
+    _generation = 0  # Bumped when the whole cache is cleared
+    _cache_lock = threading.Lock()
+    _cache_ttl = 300  # 5 minutes
+    _max_entries = 10000
+    _load_locks = tuple(threading.Lock() for _ in range(64))
+    _hits = 0
+    _misses = 0
+
+    def get_rules(self, project_id: str) -> Optional[CachedRuleSet]:
+        """Return cached rules for a project, or None on a miss or expired entry"""
+        with RuleCache._cache_lock:
+            cached = RuleCache._lookup(project_id)
+            if cached is None:
+                RuleCache._misses += 1
+            else:
+                RuleCache._hits += 1
+            return cached
+
+    def peek_rules(self, project_id: str) -> Optional[CachedRuleSet]:
+        """Like get_rules, without counting towards the hit/miss stats"""
+        with RuleCache._cache_lock:
+            return RuleCache._lookup(project_id)
+
+    @staticmethod
+    def _lookup(project_id: str) -> Optional[CachedRuleSet]:
+        # Caller holds _cache_lock
+        entry = RuleCache._entries.get(project_id)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1]:
+            del RuleCache._entries[project_id]
+            return None
+        return entry[0]
+
+    def load_lock(self, project_id: str) -> threading.Lock:
+        """Lock to hold while loading a project's rules after a miss (re-check the cache once held)"""
+        return RuleCache._load_locks[hash(project_id) % len(RuleCache._load_locks)]
+
+    def get_version(self, project_id: str) -> Tuple[int, int]:
+        """Current version for a project; read it before loading rules from the database"""
+        with RuleCache._cache_lock:
+            return RuleCache._generation, RuleCache._versions.get(project_id, 0)
+
+    def set_rules(self, project_id: str, rules, version: Tuple[int, int]) -> CachedRuleSet:
+        """Store rules loaded at ``version``; skipped if the project was invalidated meanwhile"""
+        cached = CachedRuleSet.from_rules(CachedRule.from_model(rule) for rule in rules)
+        with RuleCache._cache_lock:
+            if (RuleCache._generation, RuleCache._versions.get(project_id, 0)) == version:
+                RuleCache._entries.pop(project_id, None)
+                if len(RuleCache._entries) >= RuleCache._max_entries:
+                    RuleCache._entries.pop(next(iter(RuleCache._entries)))
+                RuleCache._entries[project_id] = (cached, time.monotonic() + RuleCache._cache_ttl)
+        return cached
+
+    def invalidate(self, project_id: Optional[str] = None) -> None:
+        """Drop cached rules for one project, or for all projects"""
+        with RuleCache._cache_lock:
+            if project_id:
+                RuleCache._entries.pop(project_id, None)
+                RuleCache._versions[project_id] = RuleCache._versions.get(project_id, 0) + 1
+            else:
+                RuleCache._entries.clear()
+                # The generation bump supersedes every per-project version
+                RuleCache._versions.clear()
+                RuleCache._generation += 1
+                logger.info("Rule cache cleared completely")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring"""
+        with RuleCache._cache_lock:
+            lookups = RuleCache._hits + RuleCache._misses
+            return {
+                'cached_projects': len(RuleCache._entries),
+                'cached_rules': sum(len(rule_set.rules) for rule_set, _ in RuleCache._entries.values()),
+                'ttl_seconds': RuleCache._cache_ttl,
+                'max_entries': RuleCache._max_entries,
+                'hits': RuleCache._hits,
+                'misses': RuleCache._misses,
+                'hit_ratio': RuleCache._hits / lookups if lookups else 0.0
+            }
+
+
+rule_cache = RuleCache()
@@ -1,9 +1,26 @@
+import atexit
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 
 from flask import current_app
 
+from config.config import Config
+
+from .keyword_matcher import parse_keywords
+from .regex_prefilter import regex_flags
+
+# One process-wide pool for AI rule fan-out instead of a new pool (and threads) per request
+_ai_rule_executor = ThreadPoolExecutor(max_workers=Config.AI_RULE_POOL_SIZE, thread_name_prefix='ai-rule')
+atexit.register(_ai_rule_executor.shutdown, wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=4096)
+def _compile_pattern(pattern, flags):
+    """Compiled regex for a rule pattern, memoized across requests (keyed by pattern, so never stale)"""
+    return re.compile(pattern, flags)
+
 
 class RuleProcessor:
     """Handles evaluation of different rule types (keyword, regex, AI)"""
@@ -11,35 +28,27 @@ class RuleProcessor:
     def __init__(self, openai_service):
         self.openai_service = openai_service
 
-    def apply_fast_rule(self, rule, content):
-        """Apply keyword/regex rules (instant processing)"""
-        start_time = time.time()
-        try:
-            rule_data = rule.rule_data
-            content_text = content.content_data
-            matched = False
-            reason = ""
+    def apply_fast_rule(self, rule, content, content_lower=None):
+        """Apply keyword/regex rules (instant processing)
+
+        ``content_lower`` is the lowercased content text, computed once by the caller and
+        shared by every case-insensitive keyword rule.
+        """
+        rule_type = rule.rule_type
+        if rule_type != 'keyword' and rule_type != 'regex':
+            return None
 
-            if rule.rule_type == 'keyword':
+        start_time = time.monotonic()
+        try:
+            if rule_type == 'keyword':
                 matched, reason = self._check_keyword_rule(
-                    content_text, rule_data)
-            elif rule.rule_type == 'regex':
+                    content.content_data, rule.rule_data, getattr(rule, 'matcher', None), content_lower)
+            else:
                 matched, reason = self._check_regex_rule(
-                    content_text, rule_data)
+                    content.content_data, rule.rule_data)
 
             if matched:
-                return {
-                    'decision': rule.action,
-                    'confidence': 0.8,
-                    'reason': f"Rule '{rule.name}': {reason}",
-                    'moderator_type': 'rule',
-                    'rule_id': rule.id,
-                    'rule_name': rule.name,
-                    'rule_type': rule.rule_type,
-                    'processing_time': time.time() - start_time,
-                    'categories': {f'rule_{rule.rule_type}': True},
-                    'category_scores': {f'rule_{rule.rule_type}': 0.8}
-                }
+                return self._fast_rule_result(rule, reason, time.monotonic() - start_time)
 
             return None
 
@@ -47,122 +56,168 @@ class RuleProcessor:
             current_app.logger.error(f"Fast rule error {rule.id}: {str(e)}")
             return None
 
+    def apply_fast_rules(self, rule_set, content, content_lower=None):
+        """Return the result of the highest-priority matching keyword/regex rule, or None
+
+        When the rule set has a project-wide keyword matcher, every keyword rule is
+        checked in one pass up front. Regex rules are evaluated one by one in priority
+        order, unless the combined regex prefilter shows none of them can match.
+        """
+        keyword_matches = None
+        if rule_set.keyword_matcher is not None:
+            start_time = time.monotonic()
+            try:
+                keyword_matches = rule_set.keyword_matcher.search(content.content_data, content_lower)
+            except Exception as e:
+                current_app.logger.error(f"Keyword matcher error: {str(e)}")
+
+        skip_regex = False
+        if rule_set.regex_prefilter is not None:
+            try:
+                skip_regex = not rule_set.regex_prefilter.may_match(content.content_data)
+            except Exception as e:
+                current_app.logger.error(f"Regex prefilter error: {str(e)}")
+
+        for rule in rule_set.fast_rules:
+            if keyword_matches is not None and rule.rule_type == 'keyword':
+                keyword = keyword_matches.get(rule.id)
+                if keyword is not None:
+                    return self._fast_rule_result(
+                        rule, f"Matched keyword: '{keyword}'", time.monotonic() - start_time)
+                continue
+            if skip_regex and rule.rule_type == 'regex':
+                continue
+
+            result = self.apply_fast_rule(rule, content, content_lower)
+            if result:
+                return result
+
+        return None
+
+    def _fast_rule_result(self, rule, reason, processing_time):
+        return {
+            'decision': rule.action,
+            'confidence': 0.8,
+            'reason': f"Rule '{rule.name}': {reason}",
+            'moderator_type': 'rule',
+            'rule_id': rule.id,
+            'rule_name': rule.name,
+            'rule_type': rule.rule_type,
+            'processing_time': processing_time,
+            'categories': {f'rule_{rule.rule_type}': True},
+            'category_scores': {f'rule_{rule.rule_type}': 0.8}
+        }
+
     def process_ai_rules_parallel(self, ai_rules, content):
         """Process AI rules in true parallel with optimal performance"""
         if not ai_rules:
             return {}
 
         results = {}
-        app = current_app._get_current_object()
+        # Pool threads run without an app context: the moderator was configured when it was
+        # created, and logging goes through the app's logger captured here
+        logger = current_app._get_current_object().logger
 
         # Process AI rules in parallel
 
         def process_single_ai_rule(rule):
             try:
-                with app.app_context():
-                    start_time = time.time()
-                    rule_data = rule.rule_data
-
-                    # Use the provided OpenAI service
-                    ai_result = self.openai_service.moderate_content(
-                        content.content_data,
-                        content.content_type,
-                        rule_data.get('prompt', '')
-                    )
+                start_time = time.monotonic()
+                rule_data = rule.rule_data
+
+                # Use the provided OpenAI service
+                ai_result = self.openai_service.moderate_content(
+                    content.content_data,
+                    content.content_type,
+                    rule_data.get('prompt', '')
+                )
 
-                    # Check if rule matched
-                    if 'configuration_error' in ai_result.get('categories', {}):
-                        matched = True
-                        reason = "OpenAI unavailable - applying rule action"
-                        confidence = 0.5
-                    else:
-                        matched = ai_result['decision'] == 'rejected'
-                        reason = ai_result.get('reason', 'AI analysis')
-                        confidence = ai_result.get('confidence', 0.8)
-
-                    processing_time = time.time() - start_time
-
-                    if matched:
-                        return (rule.id, {
-                            'decision': rule.action,
-                            'confidence': confidence,
-                            'reason': f"Rule '{rule.name}': {reason}",
-                            'moderator_type': 'rule',
-                            'rule_id': rule.id,
-                            'rule_name': rule.name,
-                            'rule_type': rule.rule_type,
-                            'processing_time': processing_time,
-                            'categories': {'rule_ai_prompt': True},
-                            'category_scores': {'rule_ai_prompt': confidence}
-                        })
-
-                    return (rule.id, None)
+                # Check if rule matched
+                if 'configuration_error' in ai_result.get('categories', {}):
+                    matched = True
+                    reason = "OpenAI unavailable - applying rule action"
+                    confidence = 0.5
+                else:
+                    matched = ai_result['decision'] == 'rejected'
+                    reason = ai_result.get('reason', 'AI analysis')
+                    confidence = ai_result.get('confidence', 0.8)
+
+                processing_time = time.monotonic() - start_time
+
+                if matched:
+                    return (rule.id, {
+                        'decision': rule.action,
+                        'confidence': confidence,
+                        'reason': f"Rule '{rule.name}': {reason}",
+                        'moderator_type': 'rule',
+                        'rule_id': rule.id,
+                        'rule_name': rule.name,
+                        'rule_type': rule.rule_type,
+                        'processing_time': processing_time,
+                        'categories': {'rule_ai_prompt': True},
+                        'category_scores': {'rule_ai_prompt': confidence}
+                    })
+
+                return (rule.id, None)
 
             except Exception as e:
-                app.logger.error(f"AI rule error {rule.id}: {str(e)}")
+                logger.error(f"AI rule error {rule.id}: {str(e)}")
                 return (rule.id, None)
 
-        # Execute in parallel
-        with ThreadPoolExecutor(max_workers=min(len(ai_rules), 200)) as executor:
-            futures = {executor.submit(
-                process_single_ai_rule, rule): rule for rule in ai_rules}
+        # Execute in parallel on the shared pool
+        futures = [_ai_rule_executor.submit(process_single_ai_rule, rule) for rule in ai_rules]
 
-            try:
-                for future in as_completed(futures, timeout=60):
+        pending = set(futures)
+        deadline = time.monotonic() + 60
+        try:
+            while pending and not results:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    current_app.logger.warning(
+                        f"AI rule timeout: {len(futures) - len(pending)}/{len(ai_rules)} completed, "
+                        f"{len(pending)} timed out after 60s"
+                    )
+                    break
+
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                # Every finished rule is collected, so a batch completing together can't lose a match
+                for future in done:
                     try:
                         rule_id, result = future.result()
                         if result:
                             results[rule_id] = result
-
-                            # Cancel remaining futures for early exit
-                            for f in futures:
-                                if f != future and not f.done():
-                                    f.cancel()
-                            break
                     except Exception as e:
                         current_app.logger.error(f"AI rule future error: {str(e)}")
 
-            except TimeoutError:
-                # Handle timeout - collect any completed futures
-                unfinished = sum(1 for f in futures if not f.done())
-                completed = len(futures) - unfinished
-                current_app.logger.warning(
-                    f"AI rule timeout: {completed}/{len(ai_rules)} completed, {unfinished} timed out after 60s"
-                )
-
-                # Try to collect results from completed futures
-                for future in futures:
-                    if future.done() and not future.cancelled():
-                        try:
-                            rule_id, result = future.result(timeout=0)
-                            if result:
-                                results[rule_id] = result
-                        except Exception as e:
-                            current_app.logger.error(f"Error collecting completed result: {str(e)}")
-
-                # Cancel unfinished futures
-                for future in futures:
-                    if not future.done():
-                        future.cancel()
+        finally:
+            # Drop this request's queued rules and return without joining; calls already in
+            # flight finish in the background and their results are discarded
+            for future in futures:
+                future.cancel()
 
         if results:
             current_app.logger.info(
                 f"AI rules: {len(results)}/{len(ai_rules)} matched")
         return results
 
-    def _check_keyword_rule(self, content, rule_data):
-        """Check keyword rule matching"""
-        keywords = rule_data.get('keywords', [])
+    def _check_keyword_rule(self, content, rule_data, matcher=None, content_lower=None):
+        """Check keyword rule matching (one automaton pass when the rule has a precompiled matcher)"""
+        if matcher is not None:
+            keyword = matcher.search(content, content_lower)
+            if keyword is not None:
+                return True, f"Matched keyword: '{keyword}'"
+            return False, "No keywords matched"
+
+        keywords = parse_keywords(rule_data.get('keywords', []))
         case_sensitive = rule_data.get('case_sensitive', False)
 
         if not keywords:
             return False, "No keywords defined"
 
-        if isinstance(keywords, str):
-            keywords = [line.strip()
-                        for line in keywords.split('\n') if line.strip()]
-
-        content_check = content if case_sensitive else content.lower()
+        if case_sensitive:
+            content_check = content
+        else:
+            content_check = content_lower if content_lower is not None else content.lower()
 
         for keyword in keywords:
             keyword_check = keyword if case_sensitive else keyword.lower()
@@ -179,18 +234,8 @@ class RuleProcessor:
         if not pattern:
             return False, "No regex pattern defined"
 
-        regex_flags = 0
-        if isinstance(flags_list, list):
-            for flag in flags_list:
-                if flag == 'i':
-                    regex_flags |= re.IGNORECASE
-                elif flag == 'm':
-                    regex_flags |= re.MULTILINE
-                elif flag == 's':
-                    regex_flags |= re.DOTALL
-
         try:
-            if re.search(pattern, content, regex_flags):
+            if _compile_pattern(pattern, regex_flags(flags_list)).search(content):
                 return True, f"Matched regex: {pattern}"
             return False, "No regex match"
         except re.error as e:
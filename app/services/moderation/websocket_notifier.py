@@ -1,80 +1,143 @@
 import logging
+import queue
 import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
 
 from flask import current_app
 
+from app import socketio
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _ContentUpdate:
+    """Immutable copy of the content fields a moderation update needs, taken on the request thread"""
+    id: str
+    project_id: str
+    content_type: str
+    content_preview: str
+    meta_data: Optional[dict]
+    updated_at: str
+
+
 class WebSocketNotifier:
-    """Handles WebSocket notifications for moderation updates"""
+    """Handles WebSocket notifications for moderation updates
+
+    Emits happen on one shared background thread instead of a thread per event.
+    Moderation updates are queued and sent in order; stats updates are coalesced
+    so only the latest stats per project are emitted on each flush.
+    """
+
+    # Shared across all instances
+    _updates = queue.Queue(maxsize=10000)
+    _pending_stats = {}  # project_id -> latest stats
+    _lock = threading.Lock()
+    _flush_interval = 0.05  # Seconds between stats flushes
+    _worker_started = False
+
+    def __init__(self):
+        if not WebSocketNotifier._worker_started:
+            WebSocketNotifier._start_worker()
+
+    @classmethod
+    def _start_worker(cls):
+        """Start the background emitter thread once per process"""
+        with cls._lock:
+            if cls._worker_started:
+                return
+            cls._worker_started = True
+        threading.Thread(target=cls._worker, name='websocket-notifier', daemon=True).start()
+
+    @classmethod
+    def _worker(cls):
+        """Drain queued moderation updates and flush coalesced stats every interval"""
+        while True:
+            deadline = time.monotonic() + cls._flush_interval
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    update = cls._updates.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                cls._send_websocket_update(*update)
+
+            with cls._lock:
+                stats_batch, cls._pending_stats = cls._pending_stats, {}
+            for project_id, stats in stats_batch.items():
+                try:
+                    socketio.emit('stats_update', stats, room=f'project_{project_id}')
+                except Exception as e:
+                    logger.error(f"Stats WebSocket error: {str(e)}")
 
     def send_update_async(self, content, decision, results, total_time):
-        """Send WebSocket update in background thread"""
+        """Queue a WebSocket update for the background emitter"""
         try:
-            content_data = {
-                'id': content.id,
-                'project_id': content.project_id,
-                'content_type': content.content_type,
-                'content_data': content.content_data,
-                'meta_data': content.meta_data,
-                'updated_at': content.updated_at.isoformat()
-            }
+            # Copy meta_data so later changes on the request thread can't leak into the emitted payload,
+            # and keep only the preview rather than holding the full text in the queue
+            content_text = content.content_data
+            snapshot = _ContentUpdate(
+                id=content.id,
+                project_id=content.project_id,
+                content_type=content.content_type,
+                content_preview=content_text[:100] + '...' if len(content_text) > 100 else content_text,
+                meta_data=dict(content.meta_data) if content.meta_data else content.meta_data,
+                updated_at=content.updated_at.isoformat()
+            )
 
             app = current_app._get_current_object()
-            threading.Thread(
-                target=self._send_websocket_update,
-                args=(app, content_data, decision, results, total_time),
-                daemon=True
-            ).start()
+            WebSocketNotifier._updates.put_nowait((app, snapshot, decision, results, total_time))
+        except queue.Full:
+            current_app.logger.warning("WebSocket update queue full, dropping update")
         except Exception as e:
             current_app.logger.error(
-                f"Failed to start WebSocket thread: {str(e)}")
+                f"Failed to queue WebSocket update: {str(e)}")
 
-    def _send_websocket_update(self, app, content_data, decision, results, total_time):
-        """Send WebSocket update with proper Flask context"""
+    @staticmethod
+    def _send_websocket_update(app, content, decision, results, total_time):
+        """Send a moderation update (no app context needed; ``app`` is only used for logging)"""
         try:
-            with app.app_context():
-                from app import socketio
-
-                # Get moderator info from first result
-                moderator_type = 'unknown'
-                moderator_name = 'Unknown'
-                rule_name = None
-
-                if results:
-                    first_result = results[0]
-                    moderator_type = first_result.get(
-                        'moderator_type', 'unknown')
-                    if moderator_type == 'rule':
-                        moderator_name = 'Rule'
-                        rule_name = first_result.get(
-                            'rule_name', 'Unknown Rule')
-                    elif moderator_type == 'ai':
-                        moderator_name = 'AI'
-                    else:
-                        moderator_name = moderator_type.title()
-
-                # Build update data
-                content_text = content_data['content_data']
-                update_data = {
-                    'content_id': content_data['id'],
-                    'project_id': content_data['project_id'],
-                    'status': decision,
-                    'content_type': content_data['content_type'],
-                    'content_preview': content_text[:100] + '...' if len(content_text) > 100 else content_text,
-                    'meta_data': content_data['meta_data'],
-                    'results_count': len(results),
-                    'processing_time': total_time or 0.0,
-                    'moderator_type': moderator_type,
-                    'moderator_name': moderator_name,
-                    'rule_name': rule_name,
-                    'timestamp': content_data['updated_at']
-                }
-
-                socketio.emit('moderation_update', update_data,
-                              room=f'project_{content_data["project_id"]}')
-                # WebSocket update sent
+            # Get moderator info from first result
+            moderator_type = 'unknown'
+            moderator_name = 'Unknown'
+            rule_name = None
+
+            if results:
+                first_result = results[0]
+                moderator_type = first_result.get(
+                    'moderator_type', 'unknown')
+                if moderator_type == 'rule':
+                    moderator_name = 'Rule'
+                    rule_name = first_result.get(
+                        'rule_name', 'Unknown Rule')
+                elif moderator_type == 'ai':
+                    moderator_name = 'AI'
+                else:
+                    moderator_name = moderator_type.title()
+
+            # Build update data
+            update_data = {
+                'content_id': content.id,
+                'project_id': content.project_id,
+                'status': decision,
+                'content_type': content.content_type,
+                'content_preview': content.content_preview,
+                'meta_data': content.meta_data,
+                'results_count': len(results),
+                'processing_time': total_time or 0.0,
+                'moderator_type': moderator_type,
+                'moderator_name': moderator_name,
+                'rule_name': rule_name,
+                'timestamp': content.updated_at
+            }
+
+            socketio.emit('moderation_update', update_data,
+                          room=f'project_{content.project_id}')
+            # WebSocket update sent
 
         except Exception as e:
             try:
@@ -83,18 +146,13 @@ class WebSocketNotifier:
                 logger.error(f"WebSocket error: {str(e)}")
 
     def send_stats_update(self, project_id, stats):
-        """Send statistics update via WebSocket"""
-        try:
-            from app import socketio
-            socketio.emit('stats_update', stats, room=f'project_{project_id}')
-            # Stats update sent
-        except Exception as e:
-            current_app.logger.error(f"Stats WebSocket error: {str(e)}")
+        """Send statistics update via WebSocket (coalesced; only the latest stats per project are sent)"""
+        with WebSocketNotifier._lock:
+            WebSocketNotifier._pending_stats[project_id] = stats
 
     def send_rule_update(self, project_id, rule_data, action='updated'):
         """Send rule update notification"""
         try:
-            from app import socketio
             update_data = {
                 'action': action,  # 'created', 'updated', 'deleted'
                 'rule': rule_data,
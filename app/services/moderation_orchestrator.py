@@ -28,22 +28,13 @@ class ModerationOrchestrator:
             if not content:
                 return {'error': 'Content not found'}
 
-            # Get rules directly from database and separate by type
-            all_rules = await db_service.get_all_rules_for_project(content.project_id, include_inactive=False)
-            fast_rules = [
-                r for r in all_rules if r.rule_type in ['keyword', 'regex']]
-            ai_rules = [r for r in all_rules if r.rule_type == 'ai_prompt']
-
-            # Count tokens once and cache for processing decisions
-            content_tokens = self.ai_moderator.count_tokens(
-                content.content_data)
-
-            # Store token count temporarily for processing optimization
-            content._temp_token_count = content_tokens
+            # Get active rules from the rule cache, already sorted and split by type
+            rule_set = await db_service.get_active_rules(content.project_id)
+            all_rules = rule_set.rules
+            ai_rules = rule_set.ai_rules
 
             # Process rules and get final decision
-            final_decision, results = self._process_rules(
-                content, fast_rules, ai_rules)
+            final_decision, results = self._process_rules(content, rule_set)
 
             # Handle edge cases
             if not results:
@@ -163,16 +154,21 @@ class ModerationOrchestrator:
                 'content_id': content_id
             }
 
-    def _process_rules(self, content, fast_rules, ai_rules):
+    def _process_rules(self, content, rule_set):
         """Process both fast and AI rules, returning first match"""
         results = []
+        ai_rules = rule_set.ai_rules
+
+        # Lowercase the content once for every case-insensitive keyword rule, not once per rule
+        content_lower = None
+        if rule_set.has_keyword_rules:
+            content_lower = content.content_data.lower()
 
-        # Process fast rules first - batch processing for better performance
-        for rule in fast_rules:
-            result = self.rule_processor.apply_fast_rule(rule, content)
-            if result:
-                results.append(result)
-                return result['decision'], results
+        # Process fast rules first - keyword rules share a single pass over the content
+        result = self.rule_processor.apply_fast_rules(rule_set, content, content_lower)
+        if result:
+            results.append(result)
+            return result['decision'], results
 
         # Process AI rules in parallel if no fast rule matched
         if ai_rules:
@@ -210,11 +206,11 @@ class ModerationOrchestrator:
 
     def _apply_default_ai_moderation(self, content):
         """Default AI moderation when no rules exist"""
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             result = self.ai_moderator.moderate_content(
                 content.content_data, content.content_type)
-            result['processing_time'] = time.time() - start_time
+            result['processing_time'] = time.monotonic() - start_time
             return result
         except Exception as e:
             current_app.logger.error(f"Default AI error: {str(e)}")
@@ -223,7 +219,7 @@ class ModerationOrchestrator:
                 'confidence': 0.0,
                 'reason': 'An internal error occurred during AI moderation',
                 'moderator_type': 'ai',
-                'processing_time': time.time() - start_time,
+                'processing_time': time.monotonic() - start_time,
                 'categories': {'error': True},
                 'category_scores': {'error': 1.0},
                 'openai_flagged': False
@@ -258,19 +254,24 @@ class ModerationOrchestrator:
         return False
 
     async def _save_results(self, content, final_decision, results, total_time):
-        """Save moderation results to database with bulk operations"""
-        # Update content status using database service to ensure persistence
-        await db_service.update_content_status(content.id, status=final_decision)
+        """Save moderation results to database with bulk operations, in a single commit"""
+        try:
+            async with db_service.transaction():
+                await self._stage_results(content, final_decision, results, total_time)
+        except Exception as e:
+            current_app.logger.error(
+                f"Error committing database changes: {str(e)}")
+            raise
+
+    async def _stage_results(self, content, final_decision, results, total_time):
+        """Write the status, API user stats and moderation results without committing"""
+        # Inside transaction() a failing write raises; a missing row is reported as False
+        if not await db_service.update_content_status(content.id, status=final_decision, commit=False):
+            raise RuntimeError(f"Content {content.id} not found while saving results")
 
-        # Update API user stats efficiently
+        # Update API user stats in place: one UPDATE, no SELECT of the user row
         if content.api_user_id:
-            try:
-                api_user = await db_service.get_api_user_by_id(content.api_user_id)
-                if api_user:
-                    api_user.update_stats(final_decision)
-            except Exception as e:
-                current_app.logger.error(
-                    f"Error updating API user stats: {str(e)}")
+            await db_service.record_api_user_decision(content.api_user_id, final_decision, commit=False)
 
         # Bulk create moderation results
         if results:
@@ -299,21 +300,8 @@ class ModerationOrchestrator:
                 )
                 moderation_results.append(moderation_result)
 
-            try:
-                await db_service.bulk_save_objects(moderation_results)
-            except Exception as e:
-                current_app.logger.error(
-                    f"Error saving moderation results: {str(e)}")
-                await db_service.rollback_transaction()
-                raise
-
-        try:
-            await db_service.commit_transaction()
-        except Exception as e:
-            current_app.logger.error(
-                f"Error committing database changes: {str(e)}")
-            await db_service.rollback_transaction()
-            raise
+            if not await db_service.bulk_save_objects(moderation_results, commit=False):
+                raise RuntimeError("Error saving moderation results")
 
     async def get_project_stats(self, project_id):
         """Get moderation statistics for a project"""
@@ -344,9 +332,6 @@ class ModerationOrchestrator:
     async def _save_error_result(self, content_id, error_type, error_message):
         """Save error result to database so we can track failures"""
         try:
-            # Update content status to 'error'
-            await db_service.update_content_status(content_id, status='error')
-
             # Create error moderation result
             error_result = ModerationResult(
                 content_id=content_id,
@@ -363,8 +348,10 @@ class ModerationOrchestrator:
                 }
             )
 
-            await db_service.bulk_save_objects([error_result])
-            await db_service.commit_transaction()
+            # Status update and error result are committed together
+            async with db_service.transaction():
+                await db_service.update_content_status(content_id, status='error', commit=False)
+                await db_service.bulk_save_objects([error_result], commit=False)
             current_app.logger.info(f"Saved error result for content {content_id}")
         except Exception as e:
             current_app.logger.error(f"Failed to save error result for content {content_id}: {str(e)}")
@@ -39,30 +39,58 @@ class Config:
     USE_DIRECT_POSTGRES = bool(os.environ.get(
         'DATABASE_URL', '').startswith('postgresql://'))
 
-    # SQLAlchemy connection pool configuration
+    # Shared ThreadPoolExecutor size for bridging sync code onto async database operations.
+    # Service calls run inline on the request thread; only run_sync() callers (websocket
+    # handlers) use this pool, so the stdlib default sizing is enough.
+    DB_THREAD_POOL_WORKERS = int(os.environ.get(
+        'DB_THREAD_POOL_WORKERS', min(32, (os.cpu_count() or 1) + 4)))
+
+    # Make listings that declare their eager loads raise on any other (lazy) relationship load,
+    # so N+1 regressions surface as errors during development instead of extra queries
+    DB_RAISE_ON_LAZY_LOAD = os.environ.get('DB_RAISE_ON_LAZY_LOAD', 'false').lower() == 'true'
+
+    # Shared worker pool for evaluating AI rules in parallel (each worker keeps its own
+    # OpenAI HTTP client, so a stable pool also keeps those connections warm)
+    AI_RULE_POOL_SIZE = int(os.environ.get('AI_RULE_POOL_SIZE', 32))
+
+    # Seconds between batched writes of buffered API key usage counts
+    API_KEY_USAGE_FLUSH_INTERVAL = float(os.environ.get('API_KEY_USAGE_FLUSH_INTERVAL', 5))
+
+    # SQLAlchemy connection pool configuration. Request threads and executor workers
+    # share this pool, so it must cover at least DB_THREAD_POOL_WORKERS connections
+    # (checked at startup); a short pool_timeout fails fast instead of queueing for minutes.
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 50,                   # Number of connections to maintain in pool (was 5)
-        'pool_timeout': 60,                # Seconds to wait for connection from pool (was 30)
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', max(50, DB_THREAD_POOL_WORKERS))),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),  # Seconds to wait for a pooled connection
         'pool_recycle': 1800,              # Seconds before recreating connection (30 min)
         'pool_pre_ping': True,             # Verify connections before use
-        'max_overflow': 100,               # Additional connections beyond pool_size (was 10)
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 100)),  # Additional connections beyond pool_size
+        'query_cache_size': 1200,          # Compiled statement cache entries (default 500)
         'echo': bool(os.environ.get('SQL_DEBUG', False))  # SQL debugging via env var
     }
 
-    # ThreadPoolExecutor configuration for async database operations
-    DB_THREAD_POOL_WORKERS = int(os.environ.get('DB_THREAD_POOL_WORKERS', '100'))
-
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    DB_RAISE_ON_LAZY_LOAD = os.environ.get('DB_RAISE_ON_LAZY_LOAD', 'true').lower() == 'true'
 
 
 class ProductionConfig(Config):
     DEBUG = False
 
 
+class TestingConfig(Config):
+    TESTING = True
+    # In-memory database; Flask-SQLAlchemy shares one connection across threads for it
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    WTF_CSRF_ENABLED = False
+    DB_RAISE_ON_LAZY_LOAD = True
+
+
 config = {
     'development': DevelopmentConfig,
     'production': ProductionConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
 }
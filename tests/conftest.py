@@ -0,0 +1,53 @@
+"""
+Shared fixtures for the in-process tests (an app on an in-memory SQLite database).
+
+The E2E tests in e2e_test.py run against a live server and do not use these.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    """One app for the whole session, on an in-memory database."""
+    return create_app("testing")
+
+
+@pytest.fixture
+def app_context(app):
+    """An app context with empty tables, cleaned up after the test."""
+    with app.app_context():
+        yield
+        db.session.remove()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
+
+
+@pytest.fixture
+def count_statements(app_context):
+    """Count the SQL statements issued inside a ``with count_statements() as statements:`` block."""
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+    return _count
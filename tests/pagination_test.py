@@ -0,0 +1,62 @@
+"""
+OFFSET and keyset pagination of the content and project listings.
+"""
+
+import asyncio
+from datetime import datetime
+
+from app import db
+from app.models.content import Content
+from app.models.project import Project
+from app.models.user import User
+from app.services.database_service import db_service
+
+
+def create_flagged_content(count: int) -> str:
+    """Create one project with count flagged items, created on consecutive days."""
+    user = User(username="owner", email="owner@example.com", password_hash="x")
+    db.session.add(user)
+    db.session.flush()
+    project = Project(name="Project", description="", user_id=user.id)
+    db.session.add(project)
+    db.session.flush()
+    for day in range(1, count + 1):
+        db.session.add(Content(project_id=project.id, content_type="text", content_data=f"Content {day}",
+                               status="flagged", created_at=datetime(2026, 1, day)))
+    db.session.commit()
+    return project.id
+
+
+def days(items) -> list:
+    return [item.created_at.day for item in items]
+
+
+def test_project_content_offset_and_keyset(app_context):
+    project_id = create_flagged_content(5)
+
+    first = asyncio.run(db_service.get_project_content(project_id, limit=2, offset=1))
+    assert days(first) == [4, 3]
+
+    cursor = (first[-1].created_at, first[-1].id)
+    rest = asyncio.run(db_service.get_project_content_with_filters(project_id, status="flagged", limit=5, after=cursor))
+    assert days(rest) == [2, 1]
+
+
+def test_flagged_content_offset_and_keyset(app_context):
+    project_id = create_flagged_content(5)
+
+    items, has_more = asyncio.run(db_service.get_flagged_content_for_projects([project_id], page=2, per_page=2))
+    assert days(items) == [3, 2]
+    assert has_more
+
+    cursor = (items[-1].created_at, items[-1].id)
+    items, has_more = asyncio.run(db_service.get_flagged_content_for_projects([project_id], per_page=2, after=cursor))
+    assert days(items) == [1]
+    assert not has_more
+
+
+def test_admin_project_listing_first_page(app_context):
+    create_flagged_content(1)
+
+    projects = asyncio.run(db_service.get_all_projects_for_admin(page=1, per_page=20))
+    assert [project["name"] for project in projects] == ["Project"]
@@ -0,0 +1,71 @@
+"""
+SQL statement counts for database service methods.
+
+Each method is run against a small and a larger data set; the number of statements
+must match the expected count for both, so an N+1 regression fails here.
+"""
+
+import asyncio
+
+import pytest
+
+from app import db
+from app.models.api_key import APIKey
+from app.models.content import Content
+from app.models.moderation_rule import ModerationRule
+from app.models.project import Project
+from app.models.user import User
+from app.services.database_service import db_service
+
+
+def create_user_with_projects(project_count: int, per_project: int = 3) -> tuple:
+    """Create a user owning project_count projects, each with keys, rules and content."""
+    user = User(username=f"owner{project_count}", email=f"owner{project_count}@example.com", password_hash="x")
+    db.session.add(user)
+    db.session.flush()
+    user_id = user.id
+
+    project_ids = []
+    for p in range(project_count):
+        project = Project(name=f"Project {p}", description="", user_id=user.id)
+        db.session.add(project)
+        db.session.flush()
+        project_ids.append(project.id)
+        for i in range(per_project):
+            db.session.add(APIKey(project_id=project.id, name=f"Key {i}", key=f"key-{project.id}-{i}"))
+            db.session.add(ModerationRule(project_id=project.id, name=f"Rule {i}", rule_type="keyword",
+                                          rule_data={"keywords": ["spam"]}, action="reject"))
+            db.session.add(Content(project_id=project.id, content_type="text", content_data=f"Content {i}",
+                                   status="approved" if i % 2 else "flagged"))
+
+    db.session.commit()
+    # Start from an empty identity map so loads are not answered from memory
+    db.session.remove()
+    return user_id, project_ids
+
+
+@pytest.mark.parametrize("project_count", [1, 5])
+def test_get_user_with_projects_statement_count(count_statements, project_count):
+    user_id, _ = create_user_with_projects(project_count)
+
+    with count_statements() as statements:
+        user = asyncio.run(db_service.get_user_with_projects(user_id))
+
+    assert user is not None
+    assert len(user.projects) == project_count
+    # User, projects, then one IN query each for api_keys and content
+    assert len(statements) == 4, statements
+
+
+@pytest.mark.parametrize("project_count", [1, 5])
+def test_get_project_stats_statement_count(count_statements, project_count):
+    _, project_ids = create_user_with_projects(project_count)
+
+    with count_statements() as statements:
+        stats = asyncio.run(db_service.get_project_stats(project_ids[0]))
+
+    assert stats["total_content"] == 3
+    assert stats["total_rules"] == 3
+    assert stats["total_api_keys"] == 3
+    # Status counters, then rule/key/recent-content counts in one statement
+    assert len(statements) == 2, statements
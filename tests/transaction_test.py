@@ -0,0 +1,67 @@
+"""
+All-or-nothing behaviour of DatabaseService.transaction().
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.models.content import Content
+from app.models.moderation_result import ModerationResult
+from app.models.project import Project
+from app.models.user import User
+from app.services.database_service import db_service
+
+
+def create_pending_content() -> str:
+    user = User(username="owner", email="owner@example.com", password_hash="x")
+    db.session.add(user)
+    db.session.flush()
+    project = Project(name="Project", description="", user_id=user.id)
+    db.session.add(project)
+    db.session.flush()
+    content = Content(project_id=project.id, content_type="text", content_data="Content", status="pending")
+    db.session.add(content)
+    db.session.commit()
+    return content.id
+
+
+def test_failed_write_rolls_back_earlier_writes(app_context):
+    content_id = create_pending_content()
+
+    async def save():
+        async with db_service.transaction():
+            assert await db_service.update_content_status(content_id, status="approved", commit=False)
+            # decision is NOT NULL, so the insert fails after the status update was staged
+            await db_service.bulk_save_objects([ModerationResult(content_id=content_id, moderator_type="rule")],
+                                               commit=False)
+
+    with pytest.raises(Exception):
+        asyncio.run(save())
+
+    db.session.remove()
+    assert db.session.get(Content, content_id).status == "pending"
+    assert ModerationResult.query.count() == 0
+
+
+def test_failed_write_is_not_followed_by_a_commit(app_context):
+    content_id = create_pending_content()
+
+    async def save():
+        async with db_service.transaction():
+            await db_service._safe_execute(lambda: db.session.execute(text("SELECT * FROM missing_table")))
+            await db_service.bulk_save_objects([ModerationResult(content_id=content_id, decision="approved",
+                                                                 moderator_type="rule")], commit=False)
+
+    with pytest.raises(Exception):
+        asyncio.run(save())
+
+    db.session.remove()
+    assert ModerationResult.query.count() == 0
+
+
+def test_failed_operation_outside_transaction_returns_none(app_context):
+    result = asyncio.run(db_service._safe_execute(lambda: db.session.execute(text("SELECT * FROM missing_table"))))
+    assert result is None